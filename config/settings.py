@@ -47,6 +47,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 요청별 쿼리 수/DB 시간 측정 (/metrics/, DEBUG 또는 스태프 요청에만 Server-Timing 헤더)
+    'vad_survey.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -80,12 +82,42 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DB_ENGINE=postgresql이면 PostgreSQL 사용 (psycopg 또는 psycopg2 설치 필요)
+# 예) DB_ENGINE=postgresql DB_NAME=vad_survey DB_USER=vad DB_PASSWORD=... DB_HOST=localhost
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'vad_survey'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            # 워커 프로세스마다 연결을 유지해 재사용 (persistent connection)
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+            'CONN_HEALTH_CHECKS': True,
+            # PgBouncer(transaction pooling) 뒤에서는 서버 측 커서를 쓸 수 없음
+            'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_PGBOUNCER', '') == '1',
+        }
     }
-}
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            # 요청마다 새로 연결하지 않고 연결을 재사용 (PRAGMA도 연결당 한 번만 실행)
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+
+# 연결마다 적용할 SQLite PRAGMA (WAL, synchronous=NORMAL 등, vad_survey/db.py 참고)
+# 잠금 대기는 PRAGMA busy_timeout으로 설정 (OPTIONS의 timeout과 같은 설정이므로 따로 두지 않음)
+# SQLITE_PRAGMAS = {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': 20000}
+# atomic()은 BEGIN IMMEDIATE로 시작해 쓰기 잠금을 busy_timeout 동안 기다림 (DEFERRED면 Django 기본 동작)
+# SQLITE_TRANSACTION_MODE = 'IMMEDIATE'
 
 
 # Password validation
@@ -145,3 +177,20 @@ LOGOUT_REDIRECT_URL = '/login/'
 LOGIN_URL = '/login/'
 
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
+
+# 튜플 할당 방식
+# 'lazy': 가입 시에는 차원만 정하고, 평가 페이지 요청 시 필요한 만큼 튜플을 할당
+# 'eager': 가입 시 VAD_ASSIGNMENT_QUOTA개의 튜플을 한 번에 할당
+VAD_ASSIGNMENT_MODE = 'lazy'
+# 작업자당 할당할 튜플 수
+VAD_ASSIGNMENT_QUOTA = 100
+# lazy 모드에서 현재 튜플 외에 미리 할당해 둘 튜플 수
+VAD_ASSIGNMENT_PREFETCH = 2
+# 튜플당 목표 할당 수 (lazy 모드에서 이 수에 도달한 튜플은 더 할당하지 않음)
+VAD_ASSIGNMENT_TARGET_COVERAGE = 6
+# 자동 할당(lazy/eager)에서 골든 튜플이 차지하는 비율 (%). 골든 튜플은 목표 할당 수와 관계없이 배정
+VAD_ASSIGNMENT_GOLD_PERCENTAGE = 10
+
+# 관리자 대시보드 통계 스냅샷의 최대 사용 시간 (초). 대시보드는 스냅샷만 읽고,
+# 이보다 오래되면 주기 갱신(refresh_dashboard_stats --interval)이 멈췄다는 경고를 표시
+VAD_DASHBOARD_MAX_AGE = 300
@@ -1,25 +1,29 @@
 # vad_survey/admin.py
-import csv
 from django import forms
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.models import User
 from django.core.management import call_command
-from django.db.models import Q
-from django.http import HttpResponse
+from django.db import transaction
+from django.db.models import Count, Exists, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.http import HttpResponseRedirect
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from django.template.response import TemplateResponse
 from django.urls import reverse, path
 from django.utils.html import format_html
-from django.utils.timezone import timedelta
 from import_export import resources
 from import_export.admin import ImportExportModelAdmin
 from django.contrib import messages
+from .assignment import DEFAULT_TARGET_COVERAGE, assign_tuples
+from .dashboard import dashboard_max_age, load_dashboard_stats
+from .db import reset_sequences
+from .exports import stream_csv
+from .services import delete_ratings
 from .models import UserWordTuple
-from .models import Word, WordTuple, Rating, UserProfile
-from django.db import connection
+from .models import Word, WordTuple, Rating, UserProfile, DimensionCounter, WordBWSCounter
 
 
 # Word 모델용 리소스 클래스
@@ -68,27 +72,13 @@ class WordAdmin(ImportExportModelAdmin):
         })
 
     def delete_queryset(self, request, queryset):
-        for word in queryset:
-            related_ratings = Rating.objects.filter(Q(best_word=word) | Q(worst_word=word))
-            user_ids = related_ratings.values_list('user_id', flat=True)
-
-            # 평가 삭제
-            related_ratings.delete()
-
-            # 단어 평가 수 초기화
-            word.total_ratings = 0
-            word.save()
-
-            # 사용자 프로필 업데이트
-            for user_id in set(user_ids):
-                try:
-                    profile = UserProfile.objects.get(user_id=user_id)
-                    profile.total_ratings = Rating.objects.filter(user=profile.user).values('word_tuple').distinct().count()
-                    profile.save()
-                except UserProfile.DoesNotExist:
-                    continue
+        with transaction.atomic():
+            # 단어가 best/worst로 선택된 평가는 단어와 함께 지워지므로 카운터와 함께 먼저 정리
+            delete_ratings(Rating.objects.filter(Q(best_word__in=queryset) | Q(worst_word__in=queryset)))
+            super().delete_queryset(request, queryset)
 
-        super().delete_queryset(request, queryset)
+    def delete_model(self, request, obj):
+        self.delete_queryset(request, Word.objects.filter(pk=obj.pk))
 
     @admin.action(description="선택한 단어로 Valence 튜플 생성")
     def generate_valence_tuples(self, request, queryset):
@@ -150,6 +140,10 @@ class WordTupleAdmin(admin.ModelAdmin):
 
     display_words.short_description = "단어"
 
+    def get_queryset(self, request):
+        # display_words가 행마다 쿼리하지 않도록 단어를 한 번에 가져옴
+        return super().get_queryset(request).prefetch_related('words')
+
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name in ['gold_best_word', 'gold_worst_word']:
             try:
@@ -169,29 +163,15 @@ class WordTupleAdmin(admin.ModelAdmin):
         with transaction.atomic():
             selected_tuple_ids = list(queryset.values_list('id', flat=True))
 
-            # 관련 객체 삭제
+            # 평가를 먼저 지우며 영향받은 단어·작업자 카운터만 집합 UPDATE로 재계산
+            ratings_deleted = delete_ratings(Rating.objects.filter(word_tuple__in=selected_tuple_ids))
             user_tuples_deleted = UserWordTuple.objects.filter(word_tuple__in=selected_tuple_ids).delete()[0]
-            ratings_deleted = Rating.objects.filter(word_tuple__in=selected_tuple_ids).delete()[0]
             tuples_deleted = queryset.count()
             queryset.delete()
 
-            # Word별 total_ratings 재계산
-            for word in Word.objects.all():
-                word.total_ratings = Rating.objects.filter(Q(best_word=word) | Q(worst_word=word)).count()
-                word.save()
-
-            # UserProfile별 total_ratings 재계산
-            for profile in UserProfile.objects.select_related('user'):
-                profile.total_ratings = Rating.objects.filter(user=profile.user).count()
-                profile.save()
-
             # ID 리셋 (전체 삭제 시에만)
             if WordTuple.objects.count() == 0:
-                with connection.cursor() as cursor:
-                    cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_wordtuple';")
-                    cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_userwordtuple';")
-                    cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_rating';")
-                    cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_wordtuple_words';")
+                reset_sequences(WordTuple, UserWordTuple, Rating, WordTuple.words.through)
 
         self.message_user(
             request,
@@ -213,15 +193,14 @@ class WordTupleAdmin(admin.ModelAdmin):
             # Word total_ratings 리셋
             Word.objects.all().update(total_ratings=0)
 
-            # UserProfile total_ratings 리셋
-            UserProfile.objects.all().update(total_ratings=0)
+            # UserProfile total_ratings, 골든 카운터 리셋
+            UserProfile.objects.all().update(total_ratings=0, gold_rated_count=0, gold_correct_count=0)
+
+            # 평가가 모두 지워졌으므로 BWS 카운터도 비움
+            WordBWSCounter.objects.all().delete()
 
             # ID 리셋
-            with connection.cursor() as cursor:
-                cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_wordtuple';")
-                cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_userwordtuple';")
-                cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_rating';")
-                cursor.execute("DELETE FROM sqlite_sequence WHERE name='vad_survey_wordtuple_words';")
+            reset_sequences(WordTuple, UserWordTuple, Rating, WordTuple.words.through)
 
         self.message_user(
             request,
@@ -231,27 +210,15 @@ class WordTupleAdmin(admin.ModelAdmin):
 
     def delete_queryset(self, request, queryset):
         with transaction.atomic():
-            # 관련 평점 및 사용자 ID 수집
-            related_ratings = Rating.objects.filter(word_tuple__in=queryset)
-            user_ids = related_ratings.values_list('user_id', flat=True)
-
-            # 평가 삭제
-            related_ratings.delete()
+            # 평가 삭제 (카운터와 작업자 total_ratings는 delete_ratings가 집합 단위로 재계산)
+            delete_ratings(Rating.objects.filter(word_tuple__in=queryset))
 
             # 튜플, 할당 삭제
             UserWordTuple.objects.filter(word_tuple__in=queryset).delete()
             queryset.delete()
 
-            # 사용자 프로필 업데이트
-            for user_id in set(user_ids):
-                try:
-                    profile = UserProfile.objects.get(user_id=user_id)
-                    profile.total_ratings = Rating.objects.filter(user_id=user_id).count()
-                    profile.save()
-                except UserProfile.DoesNotExist:
-                    continue
-
-        super().delete_queryset(request, queryset)
+    def delete_model(self, request, obj):
+        self.delete_queryset(request, WordTuple.objects.filter(pk=obj.pk))
 
 
 
@@ -275,12 +242,28 @@ class TupleAssignmentForm(forms.Form):
     )
     assign_method = forms.ChoiceField(
         choices=[
+            ('balanced', '목표 평가 수까지 균형 할당 (진행 중 할당 포함)'),
             ('random', '무작위 할당'),
-            ('least_rated', '평가 수가 적은 튜플 우선 할당'),
         ],
+        initial='balanced',
         label='할당 방식',
         widget=forms.RadioSelect
     )
+    target_coverage = forms.IntegerField(
+        min_value=1,
+        max_value=50,
+        initial=DEFAULT_TARGET_COVERAGE,
+        label='튜플당 목표 평가 수 (균형 할당)',
+        required=False
+    )
+    max_word_repeats = forms.IntegerField(
+        min_value=1,
+        max_value=10,
+        initial=1,
+        label='작업자당 같은 단어 최대 등장 횟수 (균형 할당)',
+        help_text='조건을 만족하는 튜플이 부족하면 제한을 자동으로 완화하고 경고를 표시합니다.',
+        required=False
+    )
     include_gold = forms.BooleanField(
         required=False,
         initial=True,
@@ -337,6 +320,20 @@ class UserWordTupleAdmin(admin.ModelAdmin):
 
     tuple_words_display.short_description = '단어 목록'
 
+    def get_queryset(self, request):
+        # 할당별 평가 수와 마지막 평가 시각을 서브쿼리로 함께 가져와 행마다 쿼리하지 않음
+        user_ratings = Rating.objects.filter(
+            user=OuterRef('user'), word_tuple=OuterRef('word_tuple')
+        ).order_by().values('user')
+        return super().get_queryset(request).prefetch_related('word_tuple__words').annotate(
+            user_rating_count=Coalesce(Subquery(
+                user_ratings.annotate(c=Count('id')).values('c')
+            ), 0),
+            last_rating_at=Subquery(
+                user_ratings.annotate(m=Max('created_at')).values('m')
+            ),
+        )
+
     def get_urls(self):
         urls = super().get_urls()
         custom_urls = [
@@ -379,7 +376,7 @@ class UserWordTupleAdmin(admin.ModelAdmin):
             return format_html('<span style="color:green">완료</span>')
 
         # 완료되지 않았지만 일부 평가가 있는지 확인
-        rating_count = obj.word_tuple.rating_set.filter(user=obj.user).count()
+        rating_count = obj.user_rating_count
         if rating_count > 0:
             return format_html('<span style="color:orange">진행 중 ({}/3)</span>', rating_count)
         else:
@@ -388,16 +385,12 @@ class UserWordTupleAdmin(admin.ModelAdmin):
     completion_status.short_description = '상태'
 
     def completion_time(self, obj):
-        if not obj.completed:
-            return '-'
-        try:
-            last_rating = obj.word_tuple.rating_set.filter(user=obj.user).latest('created_at')
-            time_diff = last_rating.created_at - obj.assigned_at
-            hours = time_diff.total_seconds() // 3600
-            minutes = (time_diff.total_seconds() % 3600) // 60
-            return f"{int(hours)}시간 {int(minutes)}분"
-        except:
+        if not obj.completed or obj.last_rating_at is None:
             return '-'
+        time_diff = obj.last_rating_at - obj.assigned_at
+        hours = time_diff.total_seconds() // 3600
+        minutes = (time_diff.total_seconds() % 3600) // 60
+        return f"{int(hours)}시간 {int(minutes)}분"
 
     completion_time.short_description = '소요 시간'
 
@@ -414,13 +407,14 @@ class UserWordTupleAdmin(admin.ModelAdmin):
     mark_as_not_completed.short_description = "선택한 할당을 미완료로 표시"
 
     def reassign_tuples(self, request, queryset):
-        for assignment in queryset:
-            # 기존 평가 데이터 삭제
-            assignment.word_tuple.rating_set.filter(user=assignment.user).delete()
+        with transaction.atomic():
+            # 선택한 할당의 (작업자, 튜플)에 해당하는 기존 평가 데이터 삭제
+            delete_ratings(Rating.objects.filter(Exists(
+                queryset.filter(user=OuterRef('user'), word_tuple=OuterRef('word_tuple'))
+            )))
             # 할당 초기화
-            assignment.completed = False
-            assignment.save()
-        self.message_user(request, f"{queryset.count()}개 할당이 재설정되었습니다.")
+            reset = queryset.update(completed=False)
+        self.message_user(request, f"{reset}개 할당이 재설정되었습니다.")
 
     reassign_tuples.short_description = "선택한 할당을 재설정 (평가 데이터 삭제)"
 
@@ -435,80 +429,32 @@ class UserWordTupleAdmin(admin.ModelAdmin):
                 assign_method = form.cleaned_data['assign_method']
                 include_gold = form.cleaned_data['include_gold']
                 gold_percentage = form.cleaned_data.get('gold_percentage', 10)
+                target_coverage = form.cleaned_data.get('target_coverage') or DEFAULT_TARGET_COVERAGE
+                max_word_repeats = form.cleaned_data.get('max_word_repeats') or 1
+
+                total_assigned, short_users, relaxed_users = assign_tuples(
+                    users, dimension, tuples_per_user,
+                    assign_method=assign_method,
+                    include_gold=include_gold,
+                    gold_percentage=gold_percentage,
+                    target_coverage=target_coverage,
+                    max_word_repeats=max_word_repeats,
+                )
 
-                from django.db import transaction
-                from vad_survey.models import WordTuple
-                import random
-
-                with transaction.atomic():
-                    # 해당 차원의 사용 가능한 튜플 가져오기
-                    tuples_query = WordTuple.objects.filter(dimension=dimension)
-
-                    if include_gold:
-                        # 골드 튜플과 일반 튜플 분리
-                        gold_tuples = list(tuples_query.filter(is_gold=True))
-                        regular_tuples = list(tuples_query.filter(is_gold=False))
-
-                        # 골드 튜플이 충분한지 확인
-                        gold_count = int(tuples_per_user * gold_percentage / 100)
-                        gold_count = min(gold_count, len(gold_tuples))
-                    else:
-                        gold_tuples = []
-                        regular_tuples = list(tuples_query)
-                        gold_count = 0
-
-                    # 일반 튜플 수 계산
-                    regular_count = tuples_per_user - gold_count
-
-                    # 각 작업자에게 튜플 할당
-                    total_assigned = 0
-                    for user in users:
-                        # 해당 사용자에게 이미 할당된 튜플 제외
-                        user_existing_tuples = set(UserWordTuple.objects.filter(
-                            user=user
-                        ).values_list('word_tuple__id', flat=True))
-
-                        available_regular = [t for t in regular_tuples if t.id not in user_existing_tuples]
-                        available_gold = [t for t in gold_tuples if t.id not in user_existing_tuples]
-
-                        if len(available_regular) < regular_count or len(available_gold) < gold_count:
-                            self.message_user(
-                                request,
-                                f"경고: {user.username}에게 할당할 튜플이 부족합니다. 가능한만큼만 할당됩니다.",
-                                level='WARNING'
-                            )
-
-                        # 할당 방식에 따라 튜플 선택
-                        if assign_method == 'random':
-                            selected_regular = random.sample(
-                                available_regular,
-                                min(regular_count, len(available_regular))
-                            )
-                            selected_gold = random.sample(
-                                available_gold,
-                                min(gold_count, len(available_gold))
-                            )
-                        else:  # least_rated
-                            # 평가 수가 적은 순으로 정렬
-                            available_regular.sort(key=lambda t: t.rating_set.count())
-                            available_gold.sort(key=lambda t: t.rating_set.count())
-
-                            selected_regular = available_regular[:min(regular_count, len(available_regular))]
-                            selected_gold = available_gold[:min(gold_count, len(available_gold))]
-
-                        # 선택된 모든 튜플
-                        selected_tuples = selected_regular + selected_gold
-                        random.shuffle(selected_tuples)  # 순서 섞기
-
-                        # 할당 생성
-                        for tuple_obj in selected_tuples:
-                            UserWordTuple.objects.create(
-                                user=user,
-                                word_tuple=tuple_obj,
-                                completed=False
-                            )
-
-                        total_assigned += len(selected_tuples)
+                if relaxed_users:
+                    self.message_user(
+                        request,
+                        f"경고: {', '.join(user.username for user in relaxed_users)}에게는 같은 단어 "
+                        f"{max_word_repeats}회 제한을 지키는 튜플이 부족해 제한을 완화해 할당했습니다.",
+                        level='WARNING'
+                    )
+
+                for user in short_users:
+                    self.message_user(
+                        request,
+                        f"경고: {user.username}에게 할당할 튜플이 부족합니다. 가능한만큼만 할당됩니다.",
+                        level='WARNING'
+                    )
 
                 self.message_user(
                     request,
@@ -554,105 +500,15 @@ class UserWordTupleAdmin(admin.ModelAdmin):
 
 @staff_member_required
 def assignment_dashboard(request):
-    """작업 진행 상황 대시보드"""
-    from django.db.models import Count, Max
-    from django.db.models.functions import TruncDay
-    from django.utils import timezone
+    """작업 진행 상황 대시보드 (미리 계산한 스냅샷을 표시, 오래된 스냅샷은 다시 계산)"""
     import json
 
-    # 1. 기본 통계 정보
-    word_count = Word.objects.count()
-    tuple_count = WordTuple.objects.count()
-    active_users = User.objects.filter(
-        is_staff=False,
-        userprofile__is_active=True
-    ).count()
-
-    # 2. 차원별 튜플 진행 상황
-    dimension_stats = []
-    for dim, dim_name in [('V', '감정가'), ('A', '각성도'), ('D', '지배성')]:
-        total = WordTuple.objects.filter(dimension=dim).count()
-        rated = WordTuple.objects.filter(
-            dimension=dim,
-            rating__isnull=False
-        ).distinct().count()
-
-        fully_rated = WordTuple.objects.annotate(
-            rating_count=Count('rating', distinct=True)
-        ).filter(
-            dimension=dim,
-            rating_count__gte=3  # V, A, D 모두 평가된 경우
-        ).count()
-
-        if total > 0:
-            dimension_stats.append({
-                'dimension': dim,
-                'name': dim_name,
-                'total': total,
-                'rated': rated,
-                'fully_rated': fully_rated,
-                'rated_percent': round(rated / total * 100, 1),
-                'fully_rated_percent': round(fully_rated / total * 100, 1),
-            })
-
-    # 3. 일별 평가 추이 (최근 2주)
-    two_weeks_ago = timezone.now() - timedelta(days=14)
-    daily_ratings = Rating.objects.filter(
-        created_at__gte=two_weeks_ago
-    ).annotate(
-        day=TruncDay('created_at')
-    ).values('day').annotate(
-        count=Count('id')
-    ).order_by('day')
-
-    daily_chart_data = []
-    for entry in daily_ratings:
-        daily_chart_data.append({
-            'date': entry['day'].strftime('%Y-%m-%d'),
-            'count': entry['count']
-        })
-
-    # 4. 작업자별 진행 상황 (상위 20명)
-    user_stats = User.objects.filter(
-        is_staff=False
-    ).annotate(
-        assignments=Count('userwordtuple'),
-        completed=Count('userwordtuple', filter=Q(userwordtuple__completed=True)),
-        ratings=Count('rating'),
-        last_rating=Max('rating__created_at'),
-    ).order_by('-ratings')[:20]
-
-    # 5. 전체 진행률
-    progress_stats = {
-        'assignments': UserWordTuple.objects.count(),
-        'completed_assignments': UserWordTuple.objects.filter(completed=True).count(),
-        'total_ratings': Rating.objects.count(),
-        'theoretical_max_ratings': tuple_count * 3,  # 각 튜플당 V,A,D 세 개의 평가
-    }
-
-    if progress_stats['assignments'] > 0:
-        progress_stats['assignment_completion'] = round(
-            progress_stats['completed_assignments'] / progress_stats['assignments'] * 100, 1
-        )
-    else:
-        progress_stats['assignment_completion'] = 0
-
-    if progress_stats['theoretical_max_ratings'] > 0:
-        progress_stats['overall_completion'] = round(
-            progress_stats['total_ratings'] / progress_stats['theoretical_max_ratings'] * 100, 1
-        )
-    else:
-        progress_stats['overall_completion'] = 0
-
+    stats = load_dashboard_stats()
     context = {
         'title': '작업 진행 현황 대시보드',
-        'word_count': word_count,
-        'tuple_count': tuple_count,
-        'active_users': active_users,
-        'dimension_stats': dimension_stats,
-        'daily_chart_data': json.dumps(daily_chart_data),
-        'user_stats': user_stats,
-        'progress_stats': progress_stats,
+        **stats,
+        'daily_chart_data': json.dumps(stats['daily_chart_data']),
+        'max_age': dashboard_max_age(),
     }
 
     return render(request, 'admin/assignment_dashboard.html', context)
@@ -665,8 +521,19 @@ class RatingAdmin(admin.ModelAdmin):
     )
     list_filter = ('dimension', 'created_at')
     search_fields = ('user__username', 'word_tuple__id', 'best_word__text', 'worst_word__text')
+    list_select_related = ('user', 'word_tuple', 'best_word', 'worst_word')
     actions = ['export_ratings_as_csv']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('word_tuple__words')
+
+    def delete_queryset(self, request, queryset):
+        # 기본 삭제는 카운터를 거치지 않으므로 BWS·total_ratings·골든 카운터를 함께 맞춤
+        delete_ratings(queryset)
+
+    def delete_model(self, request, obj):
+        self.delete_queryset(request, Rating.objects.filter(pk=obj.pk))
+
     def get_word_tuple_display(self, obj):
         return f"Tuple {obj.word_tuple.id}"
 
@@ -686,28 +553,9 @@ class RatingAdmin(admin.ModelAdmin):
 
     @admin.action(description="선택한 평가 결과를 CSV로 내보내기")
     def export_ratings_as_csv(self, request, queryset):
-        import csv
-        from django.http import HttpResponse
-
-        response = HttpResponse(content_type='text/csv')
+        # 전체를 메모리에 만들지 않고 chunk 단위로 읽어 바로 전송
+        response = StreamingHttpResponse(stream_csv(queryset), content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="ratings.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow(['ID', 'User', 'Tuple ID', 'Tuple Words', 'Dimension', 'Best Word', 'Worst Word', 'Created At'])
-
-        for rating in queryset.select_related('user', 'word_tuple', 'best_word', 'worst_word'):
-            words = ", ".join([word.text for word in rating.word_tuple.words.all()])
-            writer.writerow([
-                rating.id,
-                rating.user.username if rating.user else 'Anonymous',
-                rating.word_tuple.id,
-                words,
-                rating.get_dimension_display(),
-                rating.best_word.text if rating.best_word else '',
-                rating.worst_word.text if rating.worst_word else '',
-                rating.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            ])
-
         return response
 
 
@@ -727,6 +575,26 @@ class UserProfileAdmin(admin.ModelAdmin):
     ]
     list_filter = ('gender', 'is_active')
     search_fields = ('user__username',)
+    list_select_related = ('user',)
+
+    def get_queryset(self, request):
+        # 골든/평가 튜플 수를 서브쿼리로 한 번에 집계해 행마다 쿼리하지 않음
+        user_ratings = Rating.objects.filter(user=OuterRef('user')).order_by().values('user')
+        gold_ratings = user_ratings.filter(word_tuple__is_gold=True)
+        assigned_gold = UserWordTuple.objects.filter(
+            user=OuterRef('user'), word_tuple__is_gold=True
+        ).order_by().values('user')
+        return super().get_queryset(request).annotate(
+            assigned_gold_count=Coalesce(Subquery(
+                assigned_gold.annotate(c=Count('id')).values('c')
+            ), 0),
+            rated_gold_count=Coalesce(Subquery(
+                gold_ratings.annotate(c=Count('word_tuple', distinct=True)).values('c')
+            ), 0),
+            rated_count=Coalesce(Subquery(
+                user_ratings.annotate(c=Count('word_tuple', distinct=True)).values('c')
+            ), 0),
+        )
 
     @admin.display(description='소나 ID')
     def get_sona_id(self, obj):
@@ -735,9 +603,9 @@ class UserProfileAdmin(admin.ModelAdmin):
     @admin.display(description='Gold accuracy (%)')
     def formatted_gold_accuracy(self, obj):
         # 할당된 골든 튜플 수
-        assigned_gold = obj.user.userwordtuple_set.filter(word_tuple__is_gold=True).count()
+        assigned_gold = obj.assigned_gold_count
         # 평가한 골든 튜플 수
-        rated_gold = obj.user.rating_set.filter(word_tuple__is_gold=True).values('word_tuple').distinct().count()
+        rated_gold = obj.rated_gold_count
 
         if assigned_gold == 0:
             return "-"  # 골든 튜플 없음
@@ -750,11 +618,11 @@ class UserProfileAdmin(admin.ModelAdmin):
 
     @admin.display(description='평가한 튜플 수')
     def rated_tuple_count(self, obj):
-        return obj.user.rating_set.values('word_tuple').distinct().count()
+        return obj.rated_count
 
     @admin.display(description='평가한 골든 튜플 수')
     def gold_tuple_count(self, obj):
-        return obj.user.rating_set.filter(word_tuple__is_gold=True).values('word_tuple').distinct().count()
+        return obj.rated_gold_count
 
     def has_change_permission(self, request, obj=None):
         return False
@@ -770,6 +638,13 @@ class UserProfileAdmin(admin.ModelAdmin):
 
 
 
+@admin.register(DimensionCounter)
+class DimensionCounterAdmin(admin.ModelAdmin):
+    list_display = ('dimension', 'weight', 'assigned_count')
+    list_editable = ('weight',)
+    readonly_fields = ('assigned_count',)
+
+
 def delete_model(self, request, obj):
     messages.success(request, "연결된 사용자 계정도 함께 삭제되었습니다.")
     super().delete_model(request, obj)
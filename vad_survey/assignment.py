@@ -0,0 +1,292 @@
+# vad_survey/assignment.py
+import heapq
+import random
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import UserProfile, UserWordTuple, WordTuple
+
+# 균형 할당에서 튜플당 목표 평가(할당) 수
+DEFAULT_TARGET_COVERAGE = 6
+
+# settings.VAD_ASSIGNMENT_<이름>이 없을 때 사용할 기본값
+ASSIGNMENT_DEFAULTS = {
+    'MODE': 'lazy',
+    'QUOTA': 100,
+    'PREFETCH': 2,
+    'TARGET_COVERAGE': DEFAULT_TARGET_COVERAGE,
+    'GOLD_PERCENTAGE': 10,
+}
+
+
+def assignment_setting(name):
+    return getattr(settings, f'VAD_ASSIGNMENT_{name}', ASSIGNMENT_DEFAULTS[name])
+
+
+def gold_share(total):
+    """할당 total개 중 골든 튜플 몫 (assign_tuples의 gold_percentage와 같은 방식으로 계산)"""
+    return int(total * assignment_setting('GOLD_PERCENTAGE') / 100)
+
+
+def load_candidates(dimension):
+    """
+    차원의 모든 튜플을 (id, 골든 여부, 할당 수) 배열로 한 번의 쿼리로 가져옵니다.
+    할당 수는 완료된 할당과 진행 중인 할당을 모두 포함합니다.
+    """
+    assignments = UserWordTuple.objects.filter(word_tuple=OuterRef('pk')).order_by().values('word_tuple')
+    rows = list(
+        WordTuple.objects.filter(dimension=dimension)
+        .annotate(
+            assignment_count=Coalesce(Subquery(assignments.annotate(c=Count('id')).values('c')), 0),
+        )
+        .order_by('id')
+        .values_list('id', 'is_gold', 'assignment_count')
+    )
+    data = np.array(rows, dtype=np.int64).reshape(-1, 3)
+    return data[:, 0], data[:, 1].astype(bool), data[:, 2]
+
+
+def load_tuple_words(dimension):
+    """차원의 튜플별 단어 id 목록 (through 테이블 한 번 조회)"""
+    words = defaultdict(list)
+    for tuple_id, word_id in WordTuple.words.through.objects.filter(
+        wordtuple__dimension=dimension
+    ).values_list('wordtuple_id', 'word_id'):
+        words[tuple_id].append(word_id)
+    return words
+
+
+def existing_assignments(user_ids, dimension):
+    """작업자별로 이미 할당된 해당 차원의 튜플 id 집합"""
+    existing = defaultdict(set)
+    for user_id, tuple_id in UserWordTuple.objects.filter(
+        user_id__in=user_ids, word_tuple__dimension=dimension
+    ).values_list('user_id', 'word_tuple_id'):
+        existing[user_id].add(tuple_id)
+    return existing
+
+
+def sample_available(rng, pool, exclude, count):
+    """
+    pool에서 exclude를 제외하고 무작위로 count개 고릅니다.
+    작업자마다 후보 리스트를 새로 만들지 않도록 겹칠 수 있는 만큼 더 뽑은 뒤 걸러냅니다.
+    """
+    overlap = len(exclude)
+    drawn = rng.sample(pool, min(count + overlap, len(pool)))
+    return [tuple_id for tuple_id in drawn if tuple_id not in exclude][:count]
+
+
+class CoverageQueue:
+    """
+    튜플을 현재 커버리지(할당 수)가 낮은 순으로 꺼내는 우선순위 큐.
+    꺼낸 튜플은 커버리지를 1 올려 다시 넣고, target에 도달하면 더 이상 배정하지 않습니다.
+    """
+
+    def __init__(self, tuple_ids, coverage, target, rng):
+        self.target = target
+        self.rng = rng
+        # 같은 커버리지끼리는 무작위 순서로 꺼내도록 난수를 두 번째 키로 사용
+        self.heap = [
+            (count, rng.random(), tuple_id)
+            for tuple_id, count in zip(tuple_ids, coverage)
+            if target is None or count < target
+        ]
+        heapq.heapify(self.heap)
+
+    def pop(self, eligible):
+        """eligible(tuple_id)를 만족하는 가장 덜 덮인 튜플을 꺼냅니다. 없으면 None"""
+        skipped = []
+        found = None
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            if eligible(entry[2]):
+                found = entry
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self.heap, entry)
+
+        if found is None:
+            return None
+        count, _, tuple_id = found
+        if self.target is None or count + 1 < self.target:
+            heapq.heappush(self.heap, (count + 1, self.rng.random(), tuple_id))
+        return tuple_id
+
+
+def balanced_selection(users, queues, counts, existing, tuple_words, max_word_repeats):
+    """
+    작업자를 돌아가며 한 개씩 가장 덜 덮인 튜플을 배정합니다.
+    한 작업자에게 같은 단어가 max_word_repeats번을 넘게 나오는 튜플은 건너뛰되,
+    조건을 만족하는 튜플이 없으면 제한을 무시하고 배정합니다.
+    (작업자별 선택 목록, 단어 반복 제한을 완화한 작업자 id 집합)을 반환합니다.
+    """
+    selections = {user.id: [] for user in users}
+    relaxed = set()
+    seen_words = {}
+    for user in users:
+        seen = defaultdict(int)
+        for tuple_id in existing[user.id]:
+            for word_id in tuple_words.get(tuple_id, ()):
+                seen[word_id] += 1
+        seen_words[user.id] = seen
+
+    for kind, queue in queues.items():
+        for _ in range(counts[kind]):
+            for user in users:
+                exclude = existing[user.id]
+                seen = seen_words[user.id]
+
+                def eligible(tuple_id):
+                    return tuple_id not in exclude and all(
+                        seen[word_id] < max_word_repeats for word_id in tuple_words.get(tuple_id, ())
+                    )
+
+                tuple_id = queue.pop(eligible)
+                if tuple_id is None:
+                    # 단어 반복 제한 때문에 작업자가 부족하게 받지 않도록 제한을 풀고 다시 고름
+                    tuple_id = queue.pop(lambda tuple_id: tuple_id not in exclude)
+                    if tuple_id is None:
+                        continue
+                    relaxed.add(user.id)
+                exclude.add(tuple_id)
+                for word_id in tuple_words.get(tuple_id, ()):
+                    seen[word_id] += 1
+                selections[user.id].append(tuple_id)
+    return selections, relaxed
+
+
+def assign_tuples(users, dimension, tuples_per_user, assign_method='balanced',
+                  include_gold=True, gold_percentage=10, target_coverage=DEFAULT_TARGET_COVERAGE,
+                  max_word_repeats=1, batch_size=1000, rng=None):
+    """
+    작업자들에게 해당 차원의 튜플을 할당하고, 할당은 bulk_create로 한꺼번에 저장합니다.
+    balanced 방식은 할당 수(완료 + 진행 중) 기준 우선순위 큐로 튜플마다 target_coverage까지 고르게 배정합니다.
+    (생성된 할당 수, 튜플이 부족했던 작업자 목록, 단어 반복 제한을 완화한 작업자 목록)을 반환합니다.
+    """
+    if assign_method not in ('balanced', 'random'):
+        raise ValueError(f"알 수 없는 할당 방식: {assign_method}")
+    rng = rng or random.Random()
+    users = list(users)
+
+    tuple_ids, is_gold, assignment_counts = load_candidates(dimension)
+    if include_gold:
+        gold_mask = is_gold
+        gold_count = min(int(tuples_per_user * (gold_percentage or 10) / 100), int(gold_mask.sum()))
+    else:
+        gold_mask = np.zeros(len(tuple_ids), dtype=bool)
+        gold_count = 0
+    regular_count = tuples_per_user - gold_count
+
+    existing = existing_assignments([user.id for user in users], dimension)
+    counts = {'regular': regular_count, 'gold': gold_count}
+
+    relaxed = set()
+    if assign_method == 'balanced':
+        queues = {
+            'regular': CoverageQueue(
+                tuple_ids[~gold_mask], assignment_counts[~gold_mask], target_coverage, rng
+            ),
+            # 골든 튜플은 품질 검증용이므로 목표 수와 관계없이 모든 작업자에게 배정
+            'gold': CoverageQueue(tuple_ids[gold_mask], assignment_counts[gold_mask], None, rng),
+        }
+        selections, relaxed = balanced_selection(
+            users, queues, counts, existing, load_tuple_words(dimension), max_word_repeats
+        )
+    else:
+        pools = {
+            'regular': tuple_ids[~gold_mask].tolist(),
+            'gold': tuple_ids[gold_mask].tolist(),
+        }
+
+    assignments = []
+    short_users = []
+    for user in users:
+        if assign_method == 'balanced':
+            selected = selections[user.id]
+            if len(selected) < tuples_per_user:
+                short_users.append(user)
+        else:
+            exclude = existing[user.id]
+            selected = []
+            for kind, count in counts.items():
+                picked = sample_available(rng, pools[kind], exclude, count)
+                if len(picked) < count:
+                    short_users.append(user)
+                selected.extend(picked)
+
+        rng.shuffle(selected)  # 순서 섞기
+        assignments.extend(
+            UserWordTuple(user=user, word_tuple_id=tuple_id, completed=False)
+            for tuple_id in selected
+        )
+
+    with transaction.atomic():
+        UserWordTuple.objects.bulk_create(
+            assignments, batch_size=batch_size, ignore_conflicts=True
+        )
+
+    relaxed_users = [user for user in users if user.id in relaxed]
+    return len(assignments), list(dict.fromkeys(short_users)), relaxed_users
+
+
+def assign_on_signup(user, dimension):
+    """
+    eager 모드: 가입 시 할당량만큼 무작위 튜플을 한 번의 INSERT로 할당합니다.
+    할당량의 GOLD_PERCENTAGE만큼은 골든 튜플에서 고릅니다.
+    """
+    quota = assignment_setting('QUOTA')
+    candidates = WordTuple.objects.filter(dimension=dimension).order_by('?')
+    tuple_ids = list(candidates.filter(is_gold=True).values_list('id', flat=True)[:gold_share(quota)])
+    tuple_ids += candidates.filter(is_gold=False).values_list('id', flat=True)[:quota - len(tuple_ids)]
+    UserWordTuple.objects.bulk_create(
+        [UserWordTuple(user=user, word_tuple_id=tuple_id) for tuple_id in tuple_ids],
+        ignore_conflicts=True,
+    )
+
+
+def draw_next_tuples(user):
+    """
+    lazy 모드: 평가할 튜플이 떨어졌을 때 호출합니다.
+    할당량 안에서 현재 튜플과 미리 할당분(PREFETCH)만큼, 할당 수가 가장 적고
+    목표 수에 도달하지 않은 튜플을 골라 할당합니다.
+    골든 튜플은 assign_tuples와 같이 목표 수와 관계없이 무작위로 고르며, 지금까지의 할당 수에
+    비례해 GOLD_PERCENTAGE만큼 섞이도록 모자란 몫을 먼저 채웁니다. 새로 할당한 수를 반환합니다.
+    """
+    dimension = UserProfile.objects.filter(user=user).values_list('dimension', flat=True).first()
+    if not dimension:
+        return 0
+
+    assigned = UserWordTuple.objects.filter(user=user).aggregate(
+        total=Count('id'),
+        gold=Count('id', filter=Q(word_tuple__is_gold=True)),
+    )
+    count = min(1 + assignment_setting('PREFETCH'), assignment_setting('QUOTA') - assigned['total'])
+    if count <= 0:
+        return 0
+    gold_count = min(count, max(0, gold_share(assigned['total'] + count) - assigned['gold']))
+
+    already_assigned = UserWordTuple.objects.filter(user=user, word_tuple=OuterRef('pk'))
+    candidates = WordTuple.objects.filter(dimension=dimension).filter(~Exists(already_assigned))
+    tuple_ids = []
+    if gold_count:
+        tuple_ids = list(
+            candidates.filter(is_gold=True).order_by('?').values_list('id', flat=True)[:gold_count]
+        )
+    tuple_ids += (
+        candidates.filter(is_gold=False)
+        .annotate(coverage=Count('userwordtuple'))
+        .filter(coverage__lt=assignment_setting('TARGET_COVERAGE'))
+        .order_by('coverage', '?')
+        .values_list('id', flat=True)[:count - len(tuple_ids)]
+    )
+    UserWordTuple.objects.bulk_create(
+        [UserWordTuple(user=user, word_tuple_id=tuple_id) for tuple_id in tuple_ids],
+        ignore_conflicts=True,
+    )
+    return len(tuple_ids)
@@ -0,0 +1,154 @@
+# vad_survey/dashboard.py
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Count, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, TruncDay
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import DashboardSnapshot, Rating, UserWordTuple, Word, WordTuple
+
+DIMENSION_NAMES = (('V', '감정가'), ('A', '각성도'), ('D', '지배성'))
+# 스냅샷이 이보다 오래되면(초) 대시보드에 주기 갱신이 멈췄다는 경고를 표시 (settings.VAD_DASHBOARD_MAX_AGE)
+DEFAULT_DASHBOARD_MAX_AGE = 300
+
+
+def dashboard_max_age():
+    return getattr(settings, 'VAD_DASHBOARD_MAX_AGE', DEFAULT_DASHBOARD_MAX_AGE)
+
+
+def count_subquery(queryset, group_field, aggregate=None):
+    """OuterRef로 묶인 queryset의 개수(또는 집계값)를 조인 없이 붙이는 서브쿼리"""
+    aggregate = aggregate or Count('id')
+    return Subquery(
+        queryset.order_by().values(group_field).annotate(value=aggregate).values('value')
+    )
+
+
+def compute_dashboard_stats():
+    """대시보드 숫자를 모두 계산해 JSON으로 저장할 수 있는 dict로 반환합니다."""
+    # 1. 기본 통계 정보
+    word_count = Word.objects.count()
+    tuple_count = WordTuple.objects.count()
+    active_users = User.objects.filter(is_staff=False, userprofile__is_active=True).count()
+
+    # 2. 차원별 튜플 진행 상황 (튜플별 평가 수를 서브쿼리로 붙여 차원별로 한 번에 집계)
+    tuple_ratings = Rating.objects.filter(word_tuple=OuterRef('pk'))
+    per_dimension = {
+        row['dimension']: row
+        for row in WordTuple.objects.annotate(
+            rating_count=Coalesce(count_subquery(tuple_ratings, 'word_tuple'), 0)
+        ).values('dimension').annotate(
+            total=Count('id'),
+            rated=Count('id', filter=Q(rating_count__gt=0)),
+            fully_rated=Count('id', filter=Q(rating_count__gte=3)),  # V, A, D 모두 평가된 경우
+        ).order_by()
+    }
+
+    dimension_stats = []
+    for dim, dim_name in DIMENSION_NAMES:
+        row = per_dimension.get(dim)
+        if not row or not row['total']:
+            continue
+        dimension_stats.append({
+            'dimension': dim,
+            'name': dim_name,
+            'total': row['total'],
+            'rated': row['rated'],
+            'fully_rated': row['fully_rated'],
+            'rated_percent': round(row['rated'] / row['total'] * 100, 1),
+            'fully_rated_percent': round(row['fully_rated'] / row['total'] * 100, 1),
+        })
+
+    # 3. 일별 평가 추이 (최근 2주, created_at 인덱스 범위 조회)
+    two_weeks_ago = timezone.now() - timedelta(days=14)
+    daily_chart_data = [
+        {'date': entry['day'].strftime('%Y-%m-%d'), 'count': entry['count']}
+        for entry in Rating.objects.filter(created_at__gte=two_weeks_ago)
+        .annotate(day=TruncDay('created_at'))
+        .values('day').annotate(count=Count('id')).order_by('day')
+    ]
+
+    # 4. 작업자별 진행 상황 (상위 20명)
+    # 할당과 평가를 같이 조인하면 개수가 곱해지므로 각각 서브쿼리로 집계
+    user_assignments = UserWordTuple.objects.filter(user=OuterRef('pk'))
+    user_ratings = Rating.objects.filter(user=OuterRef('pk'))
+    user_stats = [
+        {**row, 'last_rating': row['last_rating'].isoformat() if row['last_rating'] else None}
+        for row in User.objects.filter(is_staff=False).annotate(
+            assignments=Coalesce(count_subquery(user_assignments, 'user'), 0),
+            completed=Coalesce(count_subquery(user_assignments.filter(completed=True), 'user'), 0),
+            ratings=Coalesce(count_subquery(user_ratings, 'user'), 0),
+            last_rating=count_subquery(user_ratings, 'user', Max('created_at')),
+        ).order_by('-ratings').values(
+            'id', 'username', 'assignments', 'completed', 'ratings', 'last_rating'
+        )[:20]
+    ]
+
+    # 5. 전체 진행률
+    progress_stats = UserWordTuple.objects.aggregate(
+        assignments=Count('id'),
+        completed_assignments=Count('id', filter=Q(completed=True)),
+    )
+    progress_stats['total_ratings'] = Rating.objects.count()
+    progress_stats['theoretical_max_ratings'] = tuple_count * 3  # 각 튜플당 V,A,D 세 개의 평가
+
+    if progress_stats['assignments'] > 0:
+        progress_stats['assignment_completion'] = round(
+            progress_stats['completed_assignments'] / progress_stats['assignments'] * 100, 1
+        )
+    else:
+        progress_stats['assignment_completion'] = 0
+
+    if progress_stats['theoretical_max_ratings'] > 0:
+        progress_stats['overall_completion'] = round(
+            progress_stats['total_ratings'] / progress_stats['theoretical_max_ratings'] * 100, 1
+        )
+    else:
+        progress_stats['overall_completion'] = 0
+
+    return {
+        'word_count': word_count,
+        'tuple_count': tuple_count,
+        'active_users': active_users,
+        'dimension_stats': dimension_stats,
+        'daily_chart_data': daily_chart_data,
+        'user_stats': user_stats,
+        'progress_stats': progress_stats,
+    }
+
+
+def refresh_dashboard_stats():
+    """통계를 다시 계산해 스냅샷 행에 저장하고 (스냅샷, 소요 시간)을 반환합니다."""
+    started = time.perf_counter()
+    data = compute_dashboard_stats()
+    elapsed = time.perf_counter() - started
+    snapshot, _ = DashboardSnapshot.objects.update_or_create(
+        pk=DashboardSnapshot.SINGLETON_ID,
+        defaults={'data': data, 'compute_seconds': elapsed},
+    )
+    return snapshot, elapsed
+
+
+def load_dashboard_stats():
+    """
+    저장된 스냅샷을 읽어 템플릿용으로 변환합니다.
+    스냅샷이 없을 때만 바로 계산하고, 오래된 스냅샷도 그대로 보여 줍니다
+    (갱신은 refresh_dashboard_stats --interval이 담당하므로 관리자 요청마다 집계가 겹쳐 돌지 않음).
+    dashboard_max_age()초보다 오래되었으면 is_stale로 표시합니다.
+    """
+    snapshot = DashboardSnapshot.objects.filter(pk=DashboardSnapshot.SINGLETON_ID).first()
+    if snapshot is None:
+        snapshot, _ = refresh_dashboard_stats()
+
+    data = dict(snapshot.data)
+    data['user_stats'] = [
+        {**row, 'last_rating': parse_datetime(row['last_rating']) if row['last_rating'] else None}
+        for row in data['user_stats']
+    ]
+    data['refreshed_at'] = snapshot.refreshed_at
+    data['is_stale'] = snapshot.refreshed_at < timezone.now() - timedelta(seconds=dashboard_max_age())
+    return data
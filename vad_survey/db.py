@@ -0,0 +1,69 @@
+# vad_survey/db.py
+from django.conf import settings
+from django.core.management.color import no_style
+from django.db import connection
+
+# 연결마다 적용할 SQLite PRAGMA (settings.SQLITE_PRAGMAS로 덮어쓸 수 있음)
+DEFAULT_SQLITE_PRAGMAS = {
+    # 읽기와 쓰기가 서로 막지 않도록 WAL 모드 사용
+    'journal_mode': 'WAL',
+    # WAL에서는 NORMAL이어도 손상되지 않으며, 커밋마다 fsync하지 않음
+    'synchronous': 'NORMAL',
+    # 다른 연결이 쓰는 중이면 바로 실패하지 않고 최대 20초 대기 (ms)
+    'busy_timeout': 20000,
+    # 256MB까지 메모리 맵 I/O 사용
+    'mmap_size': 268435456,
+    # 연결당 페이지 캐시 64MB (음수는 KiB 단위)
+    'cache_size': -64000,
+    'temp_store': 'MEMORY',
+}
+
+
+# atomic()이 여는 트랜잭션의 BEGIN 모드 (settings.SQLITE_TRANSACTION_MODE로 덮어쓸 수 있음)
+DEFAULT_SQLITE_TRANSACTION_MODE = 'IMMEDIATE'
+SQLITE_TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+
+def sqlite_pragmas():
+    return getattr(settings, 'SQLITE_PRAGMAS', DEFAULT_SQLITE_PRAGMAS)
+
+
+def sqlite_transaction_mode():
+    return getattr(settings, 'SQLITE_TRANSACTION_MODE', DEFAULT_SQLITE_TRANSACTION_MODE)
+
+
+def apply_sqlite_pragmas(cursor, pragmas=None):
+    """주어진 커서의 연결에 PRAGMA를 적용합니다."""
+    for name, value in (sqlite_pragmas() if pragmas is None else pragmas).items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def apply_sqlite_transaction_mode(wrapper, mode=None):
+    """
+    주어진 연결(DatabaseWrapper)에서 atomic()이 BEGIN <mode>로 트랜잭션을 시작하도록 설정합니다.
+    WAL에서 DEFERRED 트랜잭션이 읽은 뒤 쓰기로 올라가면 busy_timeout을 기다리지 않고 바로
+    "database is locked"가 나므로, IMMEDIATE로 시작해 쓰기 잠금을 처음부터 기다리게 합니다.
+    (Django 5.1의 OPTIONS['transaction_mode']와 같은 동작, 4.2에는 옵션이 없어 연결마다 설정)
+    """
+    mode = (mode or sqlite_transaction_mode()).upper()
+    if mode not in SQLITE_TRANSACTION_MODES:
+        raise ValueError(f"지원하지 않는 SQLite 트랜잭션 모드입니다: {mode}")
+
+    def start_transaction_under_autocommit():
+        wrapper.cursor().execute(f"BEGIN {mode}")
+
+    wrapper._start_transaction_under_autocommit = start_transaction_under_autocommit
+
+
+def reset_sequences(*models):
+    """
+    테이블의 다음 id가 현재 최대 id 다음(비어 있으면 1)부터 시작하도록 시퀀스를 맞춥니다.
+    SQLite는 sqlite_sequence 행을 지우고, 그 외(PostgreSQL 등)는 백엔드의 시퀀스 리셋 SQL을 사용합니다.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            for model in models:
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s", [model._meta.db_table])
+        else:
+            for sql in connection.ops.sequence_reset_sql(no_style(), models):
+                cursor.execute(sql)
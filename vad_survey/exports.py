@@ -0,0 +1,62 @@
+# vad_survey/exports.py
+import csv
+
+from .models import Rating, WordTuple
+
+CSV_HEADER = ['ID', 'User', 'Tuple ID', 'Tuple Words', 'Dimension', 'Best Word', 'Worst Word', 'Created At']
+
+RATING_EXPORT_FIELDS = (
+    'id', 'user__username', 'word_tuple_id', 'dimension',
+    'best_word_id', 'best_word__text', 'worst_word_id', 'worst_word__text',
+    'response_time', 'is_active', 'created_at',
+)
+
+
+def tuple_words_map(queryset):
+    """평가 queryset에 등장하는 튜플의 단어 목록을 한 번의 쿼리로 {tuple_id: "w1, w2, ..."}로 만듦"""
+    words = {}
+    links = WordTuple.words.through.objects.filter(
+        wordtuple_id__in=queryset.order_by().values('word_tuple_id')
+    ).order_by('wordtuple_id', 'id').values_list('wordtuple_id', 'word__text')
+
+    for tuple_id, text in links.iterator(chunk_size=5000):
+        words.setdefault(tuple_id, []).append(text)
+    return {tuple_id: ", ".join(texts) for tuple_id, texts in words.items()}
+
+
+def iter_rating_records(queryset, chunk_size=2000):
+    """평가를 dict로 하나씩 반환 (모델 인스턴스를 만들지 않고 chunk 단위로 읽음)"""
+    tuple_words = tuple_words_map(queryset)
+    for record in queryset.values(*RATING_EXPORT_FIELDS).iterator(chunk_size=chunk_size):
+        record['tuple_words'] = tuple_words.get(record['word_tuple_id'], '')
+        yield record
+
+
+def iter_csv_rows(queryset, chunk_size=2000):
+    """관리자 CSV 내보내기와 같은 형식의 행을 헤더부터 차례로 반환"""
+    dimensions = dict(Rating.DIMENSIONS)
+    yield CSV_HEADER
+    for record in iter_rating_records(queryset, chunk_size):
+        yield [
+            record['id'],
+            record['user__username'] or 'Anonymous',
+            record['word_tuple_id'],
+            record['tuple_words'],
+            dimensions.get(record['dimension'], record['dimension']),
+            record['best_word__text'] or '',
+            record['worst_word__text'] or '',
+            record['created_at'].strftime('%Y-%m-%d %H:%M:%S'),
+        ]
+
+
+class Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 의사 버퍼 (스트리밍 응답용)"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(queryset, chunk_size=2000):
+    writer = csv.writer(Echo())
+    for row in iter_csv_rows(queryset, chunk_size):
+        yield writer.writerow(row)
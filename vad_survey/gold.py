@@ -0,0 +1,86 @@
+# vad_survey/gold.py
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Rating, UserProfile, UserWordTuple
+
+# 이 정확도(%) 미만이면 작업자를 비활성화
+GOLD_ACCURACY_THRESHOLD = 80
+
+
+def is_gold_correct(rating):
+    word_tuple = rating.word_tuple
+    return (rating.best_word_id == word_tuple.gold_best_word_id
+            and rating.worst_word_id == word_tuple.gold_worst_word_id)
+
+
+def record_gold_rating(rating, delta):
+    """골든 평가 하나를 작업자의 골든 카운터에 반영 (delta=1: 생성, -1: 삭제)"""
+    UserProfile.objects.filter(user_id=rating.user_id).update(
+        gold_rated_count=F('gold_rated_count') + delta,
+        gold_correct_count=F('gold_correct_count') + (delta if is_gold_correct(rating) else 0),
+    )
+    update_gold_accuracy(rating.user_id)
+
+
+def update_gold_accuracy(user_id):
+    """
+    누적 카운터로 골든 정확도와 활성 상태를 갱신합니다.
+    할당된 골든 튜플을 모두 평가하기 전에는 계산하지 않습니다.
+    Rating.is_active는 여기서 바꾸지 않고 sync_rating_activity에서 일괄 반영합니다.
+    """
+    counts = UserProfile.objects.filter(user_id=user_id).values(
+        'gold_rated_count', 'gold_correct_count'
+    ).first()
+    if counts is None:
+        return
+
+    rated_gold = counts['gold_rated_count']
+    assigned_gold = UserWordTuple.objects.filter(user_id=user_id, word_tuple__is_gold=True).count()
+
+    if rated_gold <= 0 or rated_gold < assigned_gold:
+        # 평가 미완료이거나 평가 0개이면 정확도 계산하지 않음
+        return
+
+    accuracy = counts['gold_correct_count'] / rated_gold * 100
+    UserProfile.objects.filter(user_id=user_id).update(
+        gold_accuracy=accuracy,
+        is_active=accuracy >= GOLD_ACCURACY_THRESHOLD,
+    )
+
+
+def recount_gold_counters(user_ids=None):
+    """Rating에서 작업자별 골든 카운터를 다시 계산합니다 (user_ids가 없으면 전체, 백필 및 감사용)"""
+    gold_ratings = Rating.objects.filter(
+        user=OuterRef('user'), word_tuple__is_gold=True
+    ).order_by().values('user')
+
+    profiles = UserProfile.objects.all()
+    if user_ids is not None:
+        profiles = profiles.filter(user_id__in=user_ids)
+
+    return profiles.update(
+        gold_rated_count=Coalesce(Subquery(
+            gold_ratings.annotate(c=Count('id')).values('c')
+        ), 0),
+        gold_correct_count=Coalesce(Subquery(
+            gold_ratings.annotate(c=Count('id', filter=Q(
+                best_word_id=F('word_tuple__gold_best_word_id'),
+                worst_word_id=F('word_tuple__gold_worst_word_id'),
+            ))).values('c')
+        ), 0),
+    )
+
+
+def sync_rating_activity():
+    """
+    UserProfile.is_active를 해당 작업자의 Rating.is_active에 반영합니다.
+    어긋난 행만 두 번의 집합 UPDATE로 바꾸며, 변경된 행 수를 반환합니다.
+    """
+    deactivated = Rating.objects.filter(
+        is_active=True, user__userprofile__is_active=False
+    ).update(is_active=False)
+    activated = Rating.objects.filter(
+        is_active=False, user__userprofile__is_active=True
+    ).update(is_active=True)
+    return deactivated, activated
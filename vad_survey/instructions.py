@@ -0,0 +1,35 @@
+# vad_survey/instructions.py
+from django.utils.safestring import mark_safe
+
+# 차원별 평가 안내 문구 (모듈 로드 시 한 번만 생성)
+# best: 가장 높은 단어 선택 안내, worst: 가장 낮은 단어 선택 안내
+INSTRUCTIONS = {
+    'V': {
+        'best': mark_safe(
+            '''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500"> [ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
+        'worst': mark_safe(
+            '''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
+    },
+    'A': {
+        'best': mark_safe(''' <p>아래 4개의 단어 중<br>
+                             <span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
+                             <br>또는
+                             <br><span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
+        'worst': mark_safe(''' <p>아래 4개의 단어 중<br>
+                             <span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
+                             <br>또는
+                             <br><span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
+    },
+    'D': {
+        'best': mark_safe(
+            '''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 지배적인 ], [ 통제하는 ], [ 영향력 있는 ], [ 강력한 ], [ 자율적인 ], [ 중요한 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500"> [ 지배당하는 ], [ 통제받는 ], [ 영향력 없는 ], [ 무력한 ], [ 순종적인 ], [ 하찮은 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
+        'worst': mark_safe(
+            '''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 지배당하는 ], [ 통제받는 ], [ 영향력 없는 ], [ 무력한 ], [ 순종적인 ], [ 하찮은 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500">[ 지배적인 ], [ 통제하는 ], [ 영향력 있는 ], [ 강력한 ], [ 자율적인 ], [ 중요한 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
+    },
+}
+
+def instruction_context(dimension_code):
+    """뷰 컨텍스트에 넣을 현재 차원의 안내 문구 (새 문자열을 만들지 않음)"""
+    return {
+        'instruction': INSTRUCTIONS.get(dimension_code),
+    }
@@ -0,0 +1,109 @@
+# vad_survey/management/commands/bulk_load.py
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from vad_survey.db import reset_sequences
+from vad_survey.gold import recount_gold_counters, update_gold_accuracy
+from vad_survey.models import Rating, UserProfile, Word, WordTuple
+from vad_survey.scoring import rebuild_bws_counters
+from vad_survey.services import recount_rating_totals
+
+TARGETS = {
+    'word': Word,
+    'wordtuple': WordTuple,
+    'wordtuple_words': WordTuple.words.through,
+    'rating': Rating,
+}
+
+
+class Command(BaseCommand):
+    help = ('Bulk-load a CSV (header = DB column names) into Word, WordTuple, the tuple-word links or Rating. '
+            'Uses COPY on PostgreSQL and batched INSERTs elsewhere')
+
+    def add_arguments(self, parser):
+        parser.add_argument('target', type=str, choices=sorted(TARGETS))
+        parser.add_argument('path', type=str, help='CSV file with a header row')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Rows per INSERT batch when COPY is not available')
+        parser.add_argument('--skip-recount', action='store_true',
+                            help='Do not rebuild rating counters after loading ratings')
+
+    def handle(self, *args, **options):
+        model = TARGETS[options['target']]
+        with open(options['path'], newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            raise CommandError("CSV 파일에 헤더가 없습니다.")
+
+        known = {field.column for field in model._meta.concrete_fields}
+        unknown = [column for column in header if column not in known]
+        if unknown:
+            raise CommandError(
+                f"{model._meta.db_table}에 없는 열: {', '.join(unknown)} (가능한 열: {', '.join(sorted(known))})"
+            )
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                rows = self.copy_postgres(model, header, options['path'])
+            else:
+                rows = self.insert_batches(model, header, options['path'], options['batch_size'])
+            # id를 직접 넣었으므로 다음 id가 최대 id 다음부터 시작하도록 맞춤
+            reset_sequences(model)
+
+            if model is Rating and not options['skip_recount']:
+                # COPY는 Rating.save와 시그널을 거치지 않으므로 파생 카운터를 다시 계산
+                recount_rating_totals(Word.objects.values('id'), UserProfile.objects.values('user_id'))
+                rebuild_bws_counters(options['batch_size'])
+                recount_gold_counters()
+                for user_id in UserProfile.objects.values_list('user_id', flat=True):
+                    update_gold_accuracy(user_id)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{model._meta.db_table}에 {rows}행 적재 완료 ({elapsed:.2f}초, {rows / elapsed if elapsed else 0:.0f}행/s)"
+        ))
+
+    def copy_postgres(self, model, header, path):
+        qn = connection.ops.quote_name
+        sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, HEADER true)".format(
+            qn(model._meta.db_table), ", ".join(qn(column) for column in header)
+        )
+        with connection.cursor() as cursor, open(path, 'rb') as f:
+            raw = cursor.cursor
+            if hasattr(raw, 'copy_expert'):
+                # psycopg2
+                raw.copy_expert(sql, f)
+            else:
+                # psycopg 3
+                with raw.copy(sql) as copy:
+                    while data := f.read(1 << 20):
+                        copy.write(data)
+            return raw.rowcount
+
+    def insert_batches(self, model, header, path, batch_size):
+        qn = connection.ops.quote_name
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            qn(model._meta.db_table),
+            ", ".join(qn(column) for column in header),
+            ", ".join(["%s"] * len(header)),
+        )
+        rows = 0
+        with connection.cursor() as cursor, open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader)
+            batch = []
+            for row in reader:
+                # COPY의 CSV 형식처럼 빈 값은 NULL로 처리
+                batch.append([value if value != '' else None for value in row])
+                if len(batch) >= batch_size:
+                    cursor.executemany(sql, batch)
+                    rows += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(sql, batch)
+                rows += len(batch)
+        return rows
@@ -0,0 +1,41 @@
+# vad_survey/management/commands/compute_bws_scores.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vad_survey.gold import sync_rating_activity
+from vad_survey.scoring import SCORE_FIELDS, compute_bws_scores, rebuild_bws_counters
+
+
+class Command(BaseCommand):
+    help = 'Compute BWS counting scores (best - worst) / appearances from active ratings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dimension', type=str, default=None,
+                            help='Comma separated dimensions to score (default: V,A,D)')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--rebuild-counters', action='store_true',
+                            help='Also rebuild the incremental per-word BWS counters from all ratings')
+
+    def handle(self, *args, **options):
+        dimensions = None
+        if options['dimension']:
+            dimensions = [d.strip().upper() for d in options['dimension'].split(',') if d.strip()]
+            unknown = [d for d in dimensions if d not in SCORE_FIELDS]
+            if unknown:
+                raise CommandError(f"알 수 없는 차원입니다: {', '.join(unknown)}")
+
+        # 작업자 활성 상태를 평가에 먼저 반영
+        sync_rating_activity()
+
+        started = time.perf_counter()
+        updated = compute_bws_scores(dimensions, batch_size=options['batch_size'])
+        elapsed = time.perf_counter() - started
+
+        for dimension, count in updated.items():
+            self.stdout.write(f"{dimension}: {count}개 단어 점수 갱신")
+
+        if options['rebuild_counters']:
+            counters = rebuild_bws_counters(batch_size=options['batch_size'])
+            self.stdout.write(f"BWS 카운터 {counters}개 재생성")
+        self.stdout.write(self.style.SUCCESS(f"BWS 점수 계산 완료 ({elapsed:.2f}초)"))
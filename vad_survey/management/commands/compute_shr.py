@@ -0,0 +1,68 @@
+# vad_survey/management/commands/compute_shr.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vad_survey.gold import sync_rating_activity
+from vad_survey.models import Rating
+from vad_survey.reliability import load_shr_data, split_half_reliability
+
+
+class Command(BaseCommand):
+    help = 'Compute split-half reliability (SHR) of BWS counting scores from active ratings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dimension', type=str, default=None,
+                            help='Comma separated dimensions (default: V,A,D)')
+        parser.add_argument('--trials', type=int, default=100)
+        parser.add_argument('--random-seed', type=int, default=1234)
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Number of processes to spread trials across')
+
+    def handle(self, *args, **options):
+        dimension_codes = [code for code, _ in Rating.DIMENSIONS]
+        if options['dimension']:
+            dimensions = [d.strip().upper() for d in options['dimension'].split(',') if d.strip()]
+            unknown = [d for d in dimensions if d not in dimension_codes]
+            if unknown:
+                raise CommandError(f"알 수 없는 차원입니다: {', '.join(unknown)}")
+        else:
+            dimensions = dimension_codes
+
+        if options['trials'] < 1:
+            raise CommandError("--trials는 1 이상이어야 합니다.")
+
+        # 작업자 활성 상태를 평가에 먼저 반영
+        sync_rating_activity()
+
+        for dimension in dimensions:
+            started = time.perf_counter()
+            data = load_shr_data(dimension)
+            if len(data['rating_tuple']) == 0:
+                self.stdout.write(f"{dimension}: 평가 없음")
+                continue
+
+            result = split_half_reliability(
+                data,
+                trials=options['trials'],
+                random_seed=options['random_seed'],
+                workers=options['workers'],
+            )
+            elapsed = time.perf_counter() - started
+
+            if not result['valid_trials']:
+                self.stdout.write(
+                    f"{dimension}: 평가 {result['ratings']}개, 단어 {result['words']}개 — "
+                    f"두 절반에 모두 등장한 단어가 부족해 상관을 계산할 수 없습니다 (튜플당 평가 2개 이상 필요)"
+                )
+                continue
+
+            self.stdout.write(
+                f"{dimension}: 평가 {result['ratings']}개, 단어 {result['words']}개, "
+                f"시행 {result['valid_trials']}/{result['trials']}회 — "
+                f"Spearman {result['spearman']:.4f} (±{result['spearman_std']:.4f}), "
+                f"Pearson {result['pearson']:.4f} (±{result['pearson_std']:.4f}) "
+                f"[{elapsed:.2f}초]"
+            )
+
+        self.stdout.write(self.style.SUCCESS("SHR 계산 완료"))
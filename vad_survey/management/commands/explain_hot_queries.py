@@ -0,0 +1,153 @@
+# vad_survey/management/commands/explain_hot_queries.py
+import json
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from vad_survey.models import UserWordTuple, WordTuple
+from vad_survey.services import SESSION_TUPLE_KEY
+
+# 0011_hot_query_indexes에서 추가한 인덱스 (before 측정 시 잠시 제거)
+HOT_INDEXES = (
+    'rating_active_tuple_idx',
+    'uwt_user_completed_idx',
+    'wordtuple_dim_gold_idx',
+)
+
+# 실행 계획을 기록할 관리자 changelist
+ADMIN_CHANGELISTS = ('wordtuple', 'userwordtuple', 'rating', 'userprofile')
+
+# 실행 계획을 기록할 관리 명령 (주기 실행되는 집계/정리 작업)
+COMMANDS = ('sync_rating_activity', 'reconcile_completion', 'refresh_dashboard_stats')
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Record query plans (EXPLAIN QUERY PLAN on SQLite, EXPLAIN on PostgreSQL) for the survey views, '
+            'admin pages and periodic commands with and without the hot-query indexes, and report full table scans')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', type=str, default=None, help='Write all plans as JSON to this file')
+
+    def handle(self, *args, **options):
+        worker_id = UserWordTuple.objects.filter(
+            completed=False, user__is_staff=False
+        ).values_list('user_id', flat=True).first()
+        if worker_id is None or not WordTuple.objects.exists():
+            raise CommandError("평가할 튜플이 남은 작업자가 필요합니다 (데이터를 먼저 준비하세요).")
+
+        setup_test_environment()
+        try:
+            after = self.collect(worker_id)
+            before = self.collect(worker_id, drop_indexes=True)
+        finally:
+            teardown_test_environment()
+
+        report = {}
+        for name in after:
+            report[name] = {'before': before[name], 'after': after[name]}
+            self.stdout.write(
+                f"{name}: 쿼리 {len(after[name])}개, 전체 스캔 "
+                f"{self.full_scans(before[name])} → {self.full_scans(after[name])}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"실행 계획을 {options['output']}에 저장했습니다"))
+
+    def request_paths(self, worker_id):
+        """
+        (이름, 실행 함수, 준비 함수) 목록. 뷰와 관리자 화면은 테스트 클라이언트로 실제 요청 경로를 실행합니다.
+        준비 함수의 결과가 실행 함수에 전달되며, 준비 중의 쿼리는 계획에 포함하지 않습니다.
+        """
+        worker_client = Client()
+        worker_client.force_login(User.objects.get(pk=worker_id))
+
+        # 관리자 계정은 롤백되는 트랜잭션 안에서 만들어 사용
+        admin = User(username='explain-hot-queries', is_staff=True, is_superuser=True)
+        admin.set_unusable_password()
+        admin.save()
+        admin_client = Client()
+        admin_client.force_login(admin)
+
+        rate_url = reverse('vad_survey:rate_words')
+        paths = [
+            ('GET intro', lambda _: worker_client.get(reverse('vad_survey:intro')), None),
+            ('GET rate_words', lambda _: worker_client.get(rate_url), None),
+            ('POST rate_words', lambda data: worker_client.post(rate_url, data),
+             lambda: self.rating_choice(worker_client)),
+            ('GET admin assignment dashboard',
+             lambda _: admin_client.get(reverse('admin:assignment-dashboard')), None),
+        ]
+        for model_name in ADMIN_CHANGELISTS:
+            url = reverse(f'admin:vad_survey_{model_name}_changelist')
+            paths.append((f'GET admin {model_name} changelist', lambda _, url=url: admin_client.get(url), None))
+        for command in COMMANDS:
+            paths.append((f'command {command}',
+                          lambda _, command=command: call_command(command, stdout=StringIO()), None))
+        return paths
+
+    def rating_choice(self, client):
+        """GET rate_words가 세션에 고른 튜플의 두 단어 (POST 데이터)"""
+        user_tuple = UserWordTuple.objects.get(pk=client.session[SESSION_TUPLE_KEY])
+        best, worst = user_tuple.word_tuple.words.values_list('id', flat=True)[:2]
+        return {'best_word': best, 'worst_word': worst}
+
+    def collect(self, worker_id, drop_indexes=False):
+        """각 경로를 실행해 쿼리별 실행 계획을 수집합니다. 모든 변경(인덱스 제거 포함)은 롤백합니다."""
+        plans = {}
+        try:
+            with transaction.atomic():
+                if drop_indexes:
+                    with connection.cursor() as cursor:
+                        for name in HOT_INDEXES:
+                            cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}")
+                for name, run, prepare in self.request_paths(worker_id):
+                    data = prepare() if prepare else None
+                    with CaptureQueriesContext(connection) as queries:
+                        response = run(data)
+                        # 스트리밍 응답은 본문을 끝까지 읽어야 쿼리가 모두 실행됨
+                        if getattr(response, 'streaming', False):
+                            b''.join(response.streaming_content)
+                    plans[name] = [
+                        {'sql': query['sql'], 'plan': self.explain(query['sql'], drop_indexes)}
+                        for query in queries.captured_queries
+                        if query['sql'].lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE', 'INSERT'))
+                    ]
+                raise Rollback
+        except Rollback:
+            pass
+        return plans
+
+    def explain(self, sql, without_indexes):
+        prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+        # sqlite3 모듈은 같은 SQL 문자열의 준비된 문장을 캐시하므로,
+        # 인덱스 제거 전후의 계획이 섞이지 않도록 주석으로 문자열을 구분
+        suffix = ' /* without hot indexes */' if without_indexes else ''
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql + suffix)
+            rows = cursor.fetchall()
+        # SQLite: (id, parent, notused, detail) / PostgreSQL: (QUERY PLAN,)
+        return [row[-1] for row in rows]
+
+    def full_scans(self, queries):
+        """인덱스 없이 테이블 전체를 읽는 단계 수"""
+        count = 0
+        for query in queries:
+            for line in query['plan']:
+                if connection.vendor == 'sqlite':
+                    if line.startswith('SCAN ') and 'USING' not in line:
+                        count += 1
+                elif 'Seq Scan' in line:
+                    count += 1
+        return count
@@ -0,0 +1,110 @@
+# vad_survey/management/commands/export_ratings.py
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vad_survey.exports import iter_csv_rows, iter_rating_records
+from vad_survey.models import Rating
+
+# Parquet/Arrow 열 이름 → 내보내기 레코드 키
+COLUMNS = (
+    ('id', 'id'),
+    ('user', 'user__username'),
+    ('tuple_id', 'word_tuple_id'),
+    ('tuple_words', 'tuple_words'),
+    ('dimension', 'dimension'),
+    ('best_word_id', 'best_word_id'),
+    ('best_word', 'best_word__text'),
+    ('worst_word_id', 'worst_word_id'),
+    ('worst_word', 'worst_word__text'),
+    ('response_time', 'response_time'),
+    ('is_active', 'is_active'),
+    ('created_at', 'created_at'),
+)
+
+
+class Command(BaseCommand):
+    help = 'Export ratings with their tuple words to CSV, Parquet or Arrow (Parquet/Arrow need pyarrow)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', type=str, help='Output file path')
+        parser.add_argument('--format', type=str, choices=['csv', 'parquet', 'arrow'], default='csv')
+        parser.add_argument('--dimension', type=str, default=None)
+        parser.add_argument('--active-only', action='store_true')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        queryset = Rating.objects.order_by('id')
+        if options['dimension']:
+            queryset = queryset.filter(dimension=options['dimension'])
+        if options['active_only']:
+            queryset = queryset.filter(is_active=True)
+
+        started = time.perf_counter()
+        if options['format'] == 'csv':
+            rows = self.write_csv(queryset, options['output'], options['chunk_size'])
+        else:
+            rows = self.write_columnar(queryset, options['output'], options['format'], options['chunk_size'])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"평가 {rows}개를 {options['output']}에 저장했습니다 ({elapsed:.2f}초)"
+        ))
+
+    def write_csv(self, queryset, path, chunk_size):
+        rows = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for row in iter_csv_rows(queryset, chunk_size):
+                writer.writerow(row)
+                rows += 1
+        return rows - 1
+
+    def write_columnar(self, queryset, path, file_format, chunk_size):
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise CommandError("Parquet/Arrow 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+        schema = pa.schema([
+            ('id', pa.int64()),
+            ('user', pa.string()),
+            ('tuple_id', pa.int64()),
+            ('tuple_words', pa.string()),
+            ('dimension', pa.string()),
+            ('best_word_id', pa.int64()),
+            ('best_word', pa.string()),
+            ('worst_word_id', pa.int64()),
+            ('worst_word', pa.string()),
+            ('response_time', pa.int64()),
+            ('is_active', pa.bool_()),
+            ('created_at', pa.timestamp('us', tz='UTC')),
+        ])
+
+        if file_format == 'parquet':
+            writer = pa.parquet.ParquetWriter(path, schema)
+        else:
+            writer = pa.ipc.new_file(path, schema)
+
+        rows = 0
+        columns = {name: [] for name, _ in COLUMNS}
+        try:
+            for record in iter_rating_records(queryset, chunk_size):
+                for name, key in COLUMNS:
+                    columns[name].append(record[key])
+                rows += 1
+
+                # chunk 단위로 RecordBatch를 써서 메모리 사용량을 일정하게 유지
+                if rows % chunk_size == 0:
+                    writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+                    columns = {name: [] for name, _ in COLUMNS}
+
+            if columns['id']:
+                writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+        finally:
+            writer.close()
+
+        return rows
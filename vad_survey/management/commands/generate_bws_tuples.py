@@ -1,8 +1,14 @@
 # vad_survey/management/commands/generate_bws_tuples.py
 import random
 import statistics
-from typing import List, Set, Dict
+import time
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from typing import List, Dict
+
+import numpy as np
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from vad_survey.models import Word, WordTuple
 
 
@@ -17,6 +23,12 @@ class Command(BaseCommand):
         parser.add_argument('--word-ids', type=str, default=None)
         parser.add_argument('--dimension', type=str, default=None, help='Optional dimension to save with tuples')
         parser.add_argument('--word-texts', type=str, default=None)  # 추가 가능
+        parser.add_argument('--engine', type=str, choices=['numpy', 'python'], default='numpy',
+                            help='Tuple search engine (numpy: vectorized pair counting, python: reference loop)')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Number of processes to spread iterations across')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rows per INSERT when saving tuples and tuple-word links')
 
     def handle(self, *args, **options):
         word_ids_opt = options.get('word_ids')
@@ -43,102 +55,250 @@ class Command(BaseCommand):
             items_per_tuple=options['items_per_tuple'],
             scaling_factor=options['scaling_factor'],
             num_iterations=options['iterations'],
-            random_seed=options['random_seed']
+            random_seed=options['random_seed'],
+            engine=options['engine'],
+            workers=options['workers'],
         )
 
         tuples = generator.generate_tuples(words)
 
-        tuples_created = 0
-        for tuple_words in tuples:
-            word_tuple = WordTuple.objects.create(dimension=options['dimension'])
-            word_tuple.words.set(tuple_words)
-            word_tuple.save()
-            tuples_created += 1
+        tuples_created, links_created, elapsed = save_tuples(
+            tuples, options['dimension'], batch_size=options['batch_size']
+        )
+
+        rows_per_sec = (tuples_created + links_created) / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{tuples_created}개 WordTuple 생성 완료 "
+            f"(단어 연결 {links_created}개, {elapsed:.2f}초, {rows_per_sec:,.0f} rows/s)"
+        ))
+
+
+def save_tuples(tuples, dimension=None, batch_size=1000):
+    """WordTuple과 M2M 연결 행을 하나의 트랜잭션 안에서 bulk_create로 저장"""
+    through = WordTuple.words.through
+    started = time.perf_counter()
+
+    with transaction.atomic():
+        # SQLite 3.35+/PostgreSQL에서는 bulk_create가 생성된 pk를 채워줌
+        word_tuples = WordTuple.objects.bulk_create(
+            [WordTuple(dimension=dimension) for _ in tuples],
+            batch_size=batch_size,
+        )
+        links = [
+            through(wordtuple_id=word_tuple.pk, word_id=word.pk)
+            for word_tuple, tuple_words in zip(word_tuples, tuples)
+            for word in tuple_words
+        ]
+        through.objects.bulk_create(links, batch_size=batch_size)
+
+    return len(word_tuples), len(links), time.perf_counter() - started
 
-        self.stdout.write(self.style.SUCCESS(f"{tuples_created}개 WordTuple 생성 완료"))
 
 class BWSTupleGenerator:
+    ENGINES = ('python', 'numpy')
+
     def __init__(
             self,
             items_per_tuple: int = 4,
             scaling_factor: float = 2.0,
             num_iterations: int = 100,
-            random_seed: int = 1234
+            random_seed: int = 1234,
+            engine: str = 'numpy',
+            workers: int = 1
     ):
         """Best-Worst Scaling 튜플 생성기 초기화"""
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.items_per_tuple = items_per_tuple
         self.scaling_factor = scaling_factor
         self.num_iterations = num_iterations
-        random.seed(random_seed)
+        self.random_seed = random_seed
+        self.engine = engine
+        self.workers = workers
+
+    def iteration_seeds(self) -> List[int]:
+        """random_seed에서 반복별 하위 시드를 결정적으로 생성 (작업자 수와 무관)"""
+        rng = random.Random(self.random_seed)
+        return [rng.getrandbits(64) for _ in range(self.num_iterations)]
 
     def generate_tuples(self, items: List[str]) -> List[List[str]]:
         """BWS 평가를 위한 최적의 튜플 세트 생성"""
         num_items = len(items)
-        num_unique_pairs = (num_items * (num_items - 1)) // 2
         num_tuples = round(self.scaling_factor * num_items)
 
         if num_items < self.items_per_tuple:
             raise ValueError("The number of unique items is less than the number of items requested per tuple")
 
-        best_score = float('inf')
-        best_tuples = []
+        jobs = list(enumerate(self.iteration_seeds(), start=1))
+        args = (self.engine, self.items_per_tuple, num_items, num_tuples)
+
+        if self.workers > 1 and len(jobs) > 1:
+            # 반복을 작업자 수만큼 연속 구간으로 나누고, 각 구간의 최적 결과만 돌려받음
+            chunk_size = -(-len(jobs) // self.workers)
+            chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [executor.submit(search_iterations, *args, chunk) for chunk in chunks]
+                results = [future.result() for future in futures]
+        else:
+            results = [search_iterations(*args, jobs)]
+
+        # 점수가 같으면 앞선 반복을 선택하여 순차 실행과 같은 결과 보장
+        results = [result for result in results if result is not None]
+        if not results:
+            return []
+        _, _, best_rows = min(results, key=lambda result: (result[0], result[1]))
+        return [[items[idx] for idx in row] for row in np.asarray(best_rows).tolist()]
+
+
+def search_iterations(engine: str, items_per_tuple: int, num_items: int, num_tuples: int, jobs):
+    """(반복 번호, 시드) 목록을 실행하여 가장 균형 잡힌 (점수, 반복 번호, 튜플 인덱스) 반환"""
+    best = None
+
+    for iter_num, seed in jobs:
+        rng = random.Random(seed)
+
+        if engine == 'numpy':
+            rows, score = numpy_iteration(rng, items_per_tuple, num_items, num_tuples)
+        else:
+            rows, score = python_iteration(rng, items_per_tuple, num_items, num_tuples)
+
+        # 더 좋은 밸런스(낮은 표준편차)를 가진 경우 저장
+        if score is not None and (best is None or score < best[0]):
+            best = (score, iter_num, rows)
+
+    return best
+
+
+def python_iteration(rng: random.Random, items_per_tuple: int, num_items: int, num_tuples: int):
+    """파이썬 루프 기반 기준 구현: 한 번의 반복에서 튜플 세트와 쌍 빈도 표준편차 계산"""
+    items = list(range(num_items))
+
+    # 현재 반복에서의 튜플 생성
+    tuples = []
+    ranlist = items.copy()
+    rng.shuffle(ranlist)  # 아이템 순서를 무작위로 섞음
+    freq_pair: Dict[tuple, int] = {}  # 아이템 쌍의 등장 빈도를 저장할 딕셔너리
 
-        for iter_num in range(1, self.num_iterations + 1):
-            print(f"iteration {iter_num}")
+    j = 0  # 현재 랜덤 리스트에서의 인덱스
+    for _ in range(num_tuples):
+        tuple_items = []
 
-            # 현재 반복에서의 튜플 생성
-            tuples = []
+        # 현재 랜덤 리스트에 충분한 아이템이 남아있는 경우
+        if j + items_per_tuple <= len(ranlist):
+            tuple_items = ranlist[j:j + items_per_tuple]
+            j += items_per_tuple
+        else:
+            # 남은 아이템들을 사용하고 새로운 랜덤 리스트 시작
+            current_items = set()
+            while j < len(ranlist):
+                tuple_items.append(ranlist[j])
+                current_items.add(ranlist[j])
+                j += 1
+
+            # 새로운 랜덤 리스트 생성
+            need_more = items_per_tuple - len(tuple_items)
             ranlist = items.copy()
-            random.shuffle(ranlist)  # 아이템 순서를 무작위로 섞음
-            freq_pair: Dict[str, int] = {}  # 아이템 쌍의 등장 빈도를 저장할 딕셔너리
-
-            j = 0  # 현재 랜덤 리스트에서의 인덱스
-            for _ in range(num_tuples):
-                tuple_items = []
-
-                # 현재 랜덤 리스트에 충분한 아이템이 남아있는 경우
-                if j + self.items_per_tuple <= len(ranlist):
-                    tuple_items = ranlist[j:j + self.items_per_tuple]
-                    j += self.items_per_tuple
-                else:
-                    # 남은 아이템들을 사용하고 새로운 랜덤 리스트 시작
-                    current_items = set()
-                    while j < len(ranlist):
-                        tuple_items.append(ranlist[j])
-                        current_items.add(ranlist[j])
-                        j += 1
-
-                    # 새로운 랜덤 리스트 생성
-                    need_more = self.items_per_tuple - len(tuple_items)
-                    ranlist = items.copy()
-                    random.shuffle(ranlist)
-                    j = 0
-
-                    # 필요한 만큼 새로운 아이템 추가 (중복 방지)
-                    while need_more > 0:
-                        while j < len(ranlist) and ranlist[j] in current_items:
-                            j += 1
-                        if j < len(ranlist):
-                            tuple_items.append(ranlist[j])
-                            need_more -= 1
-                            j += 1
-
-                tuples.append(tuple_items)
-
-                # 현재 튜플에서 모든 가능한 아이템 쌍의 빈도 계산
-                for i in range(len(tuple_items)):
-                    for k in range(i + 1, len(tuple_items)):
-                        # 쌍을 정렬하여 저장 (A,B와 B,A를 같은 것으로 처리)
-                        pair = tuple(sorted([tuple_items[i],tuple_items[k]], key=lambda w: w.id))
-                        freq_pair[str(pair)] = freq_pair.get(str(pair), 0) + 1
-
-            # 투웨이 밸런스 점수 계산 (쌍 빈도의 표준편차)
-            freq_values = list(freq_pair.values())
-            if len(freq_values) > 1:
-                score = statistics.stdev(freq_values)
-                # 더 좋은 밸런스(낮은 표준편차)를 가진 경우 저장
-                if score < best_score:
-                    best_score = score
-                    best_tuples = tuples
-
-        return best_tuples
+            rng.shuffle(ranlist)
+            j = 0
+
+            # 필요한 만큼 새로운 아이템 추가 (중복 방지)
+            while need_more > 0:
+                while j < len(ranlist) and ranlist[j] in current_items:
+                    j += 1
+                if j < len(ranlist):
+                    tuple_items.append(ranlist[j])
+                    need_more -= 1
+                    j += 1
+
+        tuples.append(tuple_items)
+
+        # 현재 튜플에서 모든 가능한 아이템 쌍의 빈도 계산
+        for i in range(len(tuple_items)):
+            for k in range(i + 1, len(tuple_items)):
+                # 쌍을 정렬하여 저장 (A,B와 B,A를 같은 것으로 처리)
+                pair = tuple(sorted([tuple_items[i], tuple_items[k]]))
+                freq_pair[pair] = freq_pair.get(pair, 0) + 1
+
+    # 투웨이 밸런스 점수 계산 (쌍 빈도의 표준편차)
+    freq_values = list(freq_pair.values())
+    if len(freq_values) > 1:
+        return tuples, statistics.stdev(freq_values)
+    return tuples, None
+
+
+def numpy_iteration(rng: random.Random, items_per_tuple: int, num_items: int, num_tuples: int):
+    """정수 인덱스 배열 기반 구현 (같은 시드에서 파이썬 엔진과 동일한 튜플 생성)"""
+    rows = build_index_tuples(rng, items_per_tuple, num_items, num_tuples)
+    counts = pair_frequencies(rows, num_items)
+
+    # 표준편차는 분산에 대해 단조이므로 정확한 분산(유리수)으로 비교
+    if len(counts) > 1:
+        return rows, pair_variance(counts)
+    return rows, None
+
+
+def build_index_tuples(rng: random.Random, items_per_tuple: int, num_items: int, num_tuples: int) -> np.ndarray:
+    """파이썬 엔진과 같은 순서로 shuffle을 호출하여 (num_tuples, k) 인덱스 배열 생성"""
+    k = items_per_tuple
+    rows = np.empty((num_tuples, k), dtype=np.int64)
+
+    ranlist = list(range(num_items))
+    rng.shuffle(ranlist)
+    perm = np.asarray(ranlist, dtype=np.int64)
+
+    j = 0
+    filled = 0
+    while filled < num_tuples:
+        # 현재 순열에서 잘라낼 수 있는 만큼 한 번에 채움
+        full = min((num_items - j) // k, num_tuples - filled)
+        if full > 0:
+            rows[filled:filled + full] = perm[j:j + full * k].reshape(full, k)
+            filled += full
+            j += full * k
+            continue
+
+        # 순열 경계: 남은 아이템 + 새 순열에서 중복 없이 보충
+        tuple_items = ranlist[j:]
+        current_items = set(tuple_items)
+        need_more = k - len(tuple_items)
+
+        ranlist = list(range(num_items))
+        rng.shuffle(ranlist)
+        perm = np.asarray(ranlist, dtype=np.int64)
+        j = 0
+
+        while need_more > 0:
+            while j < num_items and ranlist[j] in current_items:
+                j += 1
+            if j < num_items:
+                tuple_items.append(ranlist[j])
+                need_more -= 1
+                j += 1
+
+        rows[filled] = tuple_items
+        filled += 1
+
+    return rows
+
+
+def pair_frequencies(rows: np.ndarray, num_items: int) -> np.ndarray:
+    """튜플 인덱스 배열에서 한 번 이상 등장한 아이템 쌍의 빈도 배열 반환"""
+    k = rows.shape[1]
+    left, right = np.triu_indices(k, 1)
+    a = rows[:, left].ravel()
+    b = rows[:, right].ravel()
+    pair_ids = np.minimum(a, b) * num_items + np.maximum(a, b)
+
+    # 등장한 쌍은 약 scaling_factor * n * k(k-1)/2개로 n² 공간보다 훨씬 적으므로,
+    # 밀집 bincount(n² 배열) 대신 등장한 쌍만 정렬해 세는 np.unique가 모든 크기에서 빠름
+    return np.unique(pair_ids, return_counts=True)[1]
+
+
+def pair_variance(counts: np.ndarray) -> Fraction:
+    """쌍 빈도의 표본분산을 정확한 유리수로 계산 (statistics.stdev와 같은 기준)"""
+    n = len(counts)
+    s1 = int(counts.sum())
+    s2 = int(np.dot(counts, counts))
+    return Fraction(n * s2 - s1 * s1, n * (n - 1))
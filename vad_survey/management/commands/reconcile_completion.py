@@ -0,0 +1,12 @@
+# vad_survey/management/commands/reconcile_completion.py
+from django.core.management.base import BaseCommand
+
+from vad_survey.services import mark_rated_as_completed
+
+
+class Command(BaseCommand):
+    help = 'Mark every assignment that already has a rating for its tuple dimension as completed'
+
+    def handle(self, *args, **options):
+        updated = mark_rated_as_completed()
+        self.stdout.write(self.style.SUCCESS(f"{updated}개 할당을 완료 처리했습니다."))
@@ -0,0 +1,25 @@
+# vad_survey/management/commands/refresh_dashboard_stats.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from vad_survey.dashboard import refresh_dashboard_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the admin dashboard statistics snapshot (run periodically, e.g. from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=int, default=0,
+                            help='Keep running and refresh every N seconds (0: refresh once and exit)')
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            snapshot, elapsed = refresh_dashboard_stats()
+            self.stdout.write(self.style.SUCCESS(
+                f"대시보드 통계 갱신 완료 ({elapsed:.2f}초, {snapshot.refreshed_at:%Y-%m-%d %H:%M:%S})"
+            ))
+            if interval <= 0:
+                break
+            time.sleep(interval)
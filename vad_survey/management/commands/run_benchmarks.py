@@ -0,0 +1,268 @@
+# vad_survey/management/commands/run_benchmarks.py
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from io import StringIO
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from vad_survey.middleware import QueryRecorder
+from vad_survey.models import Rating, UserProfile, UserWordTuple, Word, WordTuple
+from vad_survey.services import SESSION_TUPLE_KEY
+from vad_survey.synthetic import generate_synthetic_dataset
+
+# 관리자 화면 측정에 쓰는 changelist
+ADMIN_CHANGELISTS = ('word', 'wordtuple', 'userwordtuple', 'rating', 'userprofile')
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Seed a synthetic lexicon into a separate benchmark database and time the survey request paths, '
+            'admin pages, CSV export and generate_bws_tuples, writing timings and query counts as JSON')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--words', type=int, default=20000)
+        parser.add_argument('--tuples', type=int, default=40000)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--ratings', type=int, default=1000000)
+        parser.add_argument('--random-seed', type=int, default=1234)
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per scenario')
+        parser.add_argument('--bws-words', type=int, default=2000,
+                            help='Words passed to generate_bws_tuples (changes are rolled back)')
+        parser.add_argument('--bws-iterations', type=int, default=10)
+        parser.add_argument('--only', type=str, default=None,
+                            help='Comma-separated substrings; run only matching scenarios')
+        parser.add_argument('--output', type=str, default=None, help='Write results as JSON to this file')
+        parser.add_argument('--compare', type=str, default=None,
+                            help='Previous JSON result to compare median times and query counts against')
+        parser.add_argument('--keepdb', action='store_true',
+                            help='Keep the benchmark database and reuse its data on the next run')
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError("--repeat는 1 이상이어야 합니다.")
+        baseline = None
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        # 운영 DB를 건드리지 않도록 테스트 러너와 같은 방식으로 별도 DB를 만들어 사용
+        # (SQLite는 기본이 메모리 DB이므로 파일 DB를 저장소 밖 임시 디렉터리에 만들고,
+        #  --keepdb일 때는 다음 실행에서 재사용할 수 있도록 시스템 임시 디렉터리에 고정된 이름으로 둠)
+        test_settings = connection.settings_dict['TEST']
+        old_test_name = test_settings.get('NAME')
+        tmp = None
+        if connection.vendor == 'sqlite' and not old_test_name:
+            if options['keepdb']:
+                test_settings['NAME'] = os.path.join(tempfile.gettempdir(), 'vad_survey_benchmark.sqlite3')
+            else:
+                tmp = tempfile.TemporaryDirectory()
+                test_settings['NAME'] = os.path.join(tmp.name, 'benchmark.sqlite3')
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        setup_test_environment()
+        try:
+            if Word.objects.exists():
+                self.stdout.write("기존 벤치마크 데이터를 재사용합니다.")
+            else:
+                started = time.perf_counter()
+                created = generate_synthetic_dataset(
+                    words=options['words'], tuples=options['tuples'], users=options['users'],
+                    ratings=options['ratings'], random_seed=options['random_seed'],
+                )
+                self.stdout.write(
+                    f"합성 데이터 생성 {time.perf_counter() - started:.1f}초: "
+                    + ", ".join(f"{name} {count}" for name, count in created.items())
+                )
+            report = self.run(options)
+        finally:
+            teardown_test_environment()
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            test_settings['NAME'] = old_test_name
+            if tmp is not None:
+                tmp.cleanup()
+
+        for name, result in report['scenarios'].items():
+            line = f"{name}: 중앙값 {result['median_ms']:.1f}ms, 쿼리 {result['queries']}개"
+            previous = (baseline or {}).get('scenarios', {}).get(name)
+            if previous:
+                line += (f" (이전 {previous['median_ms']:.1f}ms / {previous['queries']}개, "
+                         f"{result['median_ms'] / previous['median_ms']:.2f}배)" if previous['median_ms'] else "")
+            self.stdout.write(line)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"결과를 {options['output']}에 저장했습니다"))
+
+    def run(self, options):
+        admin = User.objects.filter(username='benchmark-admin').first()
+        if admin is None:
+            admin = User(username='benchmark-admin', is_staff=True, is_superuser=True)
+            admin.set_unusable_password()
+            admin.save()
+        workers = list(
+            User.objects.filter(is_staff=False, userwordtuple__completed=False).distinct().order_by('id')
+        )
+        if len(workers) < options['repeat']:
+            raise CommandError("평가할 튜플이 남은 작업자가 --repeat보다 적습니다.")
+
+        admin_client = Client()
+        admin_client.force_login(admin)
+        worker_client = Client()
+        worker_client.force_login(workers[0])
+
+        scenarios = {
+            'intro GET': lambda i: worker_client.get(reverse('vad_survey:intro')),
+            'rate_words GET': lambda i: worker_client.get(reverse('vad_survey:rate_words')),
+            'rate_words GET (current tuple)': lambda i: worker_client.get(reverse('vad_survey:rate_words')),
+            'rate_words POST': lambda state: state[0].post(reverse('vad_survey:rate_words'), state[1]),
+            'assignment_dashboard GET': lambda i: admin_client.get(reverse('admin:assignment-dashboard')),
+        }
+        for model_name in ADMIN_CHANGELISTS:
+            scenarios[f'admin {model_name} changelist'] = (
+                lambda i, url=reverse(f'admin:vad_survey_{model_name}_changelist'): admin_client.get(url)
+            )
+        scenarios['admin rating CSV export'] = self.csv_export_scenario(admin_client, workers[0])
+        scenarios['export_ratings command (csv)'] = lambda i: call_command(
+            'export_ratings', '/dev/null', stdout=StringIO()
+        )
+        scenarios['generate_bws_tuples command'] = self.generate_tuples_scenario(options)
+
+        if options['only']:
+            patterns = [p.strip() for p in options['only'].split(',') if p.strip()]
+            scenarios = {name: run for name, run in scenarios.items() if any(p in name for p in patterns)}
+
+        # 측정에서 제외할 실행별 준비 단계 (반환값이 시나리오 인자로 전달됨)
+        # 첫 진입 GET은 세션의 현재 튜플을 비워 매번 다음 튜플 선택 경로를 측정
+        setups = {
+            'intro GET': self.clear_current_tuple(worker_client),
+            'rate_words GET': self.clear_current_tuple(worker_client),
+            'rate_words POST': self.prepare_rate_post(workers),
+        }
+
+        results = {}
+        for name, scenario in scenarios.items():
+            results[name] = self.measure(scenario, options['repeat'], setups.get(name))
+
+        return {
+            'commit': self.git_commit(),
+            'recorded_at': timezone.now().isoformat(),
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+            },
+            'dataset': {
+                'words': Word.objects.count(),
+                'tuples': WordTuple.objects.count(),
+                'users': UserProfile.objects.count(),
+                'assignments': UserWordTuple.objects.count(),
+                'ratings': Rating.objects.count(),
+            },
+            'repeat': options['repeat'],
+            'scenarios': results,
+        }
+
+    def measure(self, scenario, repeat, setup=None):
+        """
+        시나리오를 repeat번 실행해 전체 시간, DB 시간, 쿼리 수를 기록합니다.
+        i번째 실행에는 setup(i)의 결과(setup이 없으면 i)를 넘깁니다.
+        """
+        totals, db_times, query_counts = [], [], []
+        for i in range(repeat):
+            state = setup(i) if setup else i
+            recorder = QueryRecorder()
+            started = time.perf_counter()
+            with connection.execute_wrapper(recorder):
+                response = scenario(state)
+                # 스트리밍 응답은 본문을 끝까지 읽어야 쿼리가 모두 실행됨
+                if getattr(response, 'streaming', False):
+                    b''.join(response.streaming_content)
+            totals.append((time.perf_counter() - started) * 1000)
+            db_times.append(recorder.duration * 1000)
+            query_counts.append(recorder.count)
+            if getattr(response, 'status_code', 200) >= 400:
+                raise CommandError(f"응답 코드 {response.status_code}")
+
+        return {
+            'median_ms': round(statistics.median(totals), 2),
+            'min_ms': round(min(totals), 2),
+            'max_ms': round(max(totals), 2),
+            'db_median_ms': round(statistics.median(db_times), 2),
+            'queries': max(query_counts),
+            'runs_ms': [round(value, 2) for value in totals],
+        }
+
+    def clear_current_tuple(self, client):
+        """세션에 저장된 현재 튜플을 지워 다음 요청이 튜플을 새로 고르게 함"""
+        def setup(i):
+            session = client.session
+            session.pop(SESSION_TUPLE_KEY, None)
+            session.save()
+            return i
+
+        return setup
+
+    def prepare_rate_post(self, workers):
+        """i번째 작업자로 평가 페이지를 연 뒤 (측정 제외) 현재 튜플의 두 단어를 제출할 준비"""
+        def setup(i):
+            client = Client()
+            client.force_login(workers[i])
+            client.get(reverse('vad_survey:rate_words'))
+            user_tuple = UserWordTuple.objects.get(pk=client.session[SESSION_TUPLE_KEY])
+            best, worst = user_tuple.word_tuple.words.values_list('id', flat=True)[:2]
+            return client, {'best_word': best, 'worst_word': worst}
+
+        return setup
+
+    def csv_export_scenario(self, admin_client, worker):
+        """관리자 평가 목록에서 한 작업자로 검색한 뒤 전체 선택(select_across)으로 CSV 내보내기"""
+        url = reverse('admin:vad_survey_rating_changelist') + f'?q={worker.username}'
+        return lambda i: admin_client.post(url, {
+            'action': 'export_ratings_as_csv',
+            'select_across': '1',
+            'index': '0',
+            '_selected_action': [0],
+        })
+
+    def generate_tuples_scenario(self, options):
+        """generate_bws_tuples를 단어 일부로 실행하고, 데이터가 쌓이지 않도록 매번 롤백"""
+        word_ids = ','.join(map(str, Word.objects.order_by('id').values_list('id', flat=True)[:options['bws_words']]))
+
+        def run(i):
+            try:
+                with transaction.atomic():
+                    call_command('generate_bws_tuples', word_ids=word_ids, dimension='V',
+                                 iterations=options['bws_iterations'], stdout=StringIO())
+                    raise Rollback
+            except Rollback:
+                pass
+
+        return run
+
+    def git_commit(self):
+        """커밋 간 비교를 위해 현재 git 커밋을 기록 (git이 없으면 None)"""
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,140 @@
+# vad_survey/management/commands/sqlite_load_test.py
+import os
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from vad_survey.dashboard import compute_dashboard_stats
+from vad_survey.models import DimensionCounter, Rating, UserProfile, WordTuple
+from vad_survey.synthetic import generate_synthetic_dataset
+
+# default: Django 기본값 (PRAGMA 없음, BEGIN DEFERRED)
+# wal: 운영 PRAGMA만 적용 (BEGIN DEFERRED) / tuned: 운영 프로필 (PRAGMA + BEGIN IMMEDIATE)
+PROFILE_SETTINGS = {
+    'default': {'SQLITE_PRAGMAS': {}, 'SQLITE_TRANSACTION_MODE': 'DEFERRED'},
+    'wal': {'SQLITE_TRANSACTION_MODE': 'DEFERRED'},
+    'tuned': {},
+}
+
+
+class Command(BaseCommand):
+    help = ('Load-test concurrent rating submissions through the real Rating.save path on a scratch copy of '
+            'the schema, with dashboard reads in parallel, comparing Django defaults with the production '
+            'SQLite profile (PRAGMAs + BEGIN IMMEDIATE). Reports throughput and error counts')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8, help='Concurrent writer threads (one worker each)')
+        parser.add_argument('--readers', type=int, default=2, help='Concurrent dashboard reader threads')
+        parser.add_argument('--writes', type=int, default=50, help='Rating submissions per writer')
+        parser.add_argument('--words', type=int, default=2000)
+        parser.add_argument('--profile', type=str, choices=['all', *PROFILE_SETTINGS], default='all')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("SQLite 데이터베이스에서만 실행할 수 있습니다.")
+
+        profiles = list(PROFILE_SETTINGS) if options['profile'] == 'all' else [options['profile']]
+        results = {}
+        for profile in profiles:
+            results[profile] = self.run_profile(profile, options)
+            r = results[profile]
+            self.stdout.write(
+                f"[{profile}] 저장 {r['writes']}건 / {r['elapsed']:.2f}초 = {r['writes_per_sec']:.0f}건/s, "
+                f"잠금 오류 {r['locked']}건, 기타 오류 {r['errors']}건, 읽기 {r['reads']}건 (읽기 오류 {r['read_errors']}건)"
+            )
+
+        if {'default', 'tuned'} <= set(results) and results['default']['writes_per_sec']:
+            gain = results['tuned']['writes_per_sec'] / results['default']['writes_per_sec']
+            self.stdout.write(self.style.SUCCESS(f"쓰기 처리량 {gain:.1f}배 (tuned / default)"))
+
+    def run_profile(self, profile, options):
+        test_settings = connection.settings_dict['TEST']
+        old_test_name = test_settings.get('NAME')
+        old_name = connection.settings_dict['NAME']
+
+        with tempfile.TemporaryDirectory() as tmp, override_settings(**PROFILE_SETTINGS[profile]):
+            # 운영 DB와 분리된 임시 파일 DB (스레드마다 별도 연결을 쓰므로 메모리 DB는 사용할 수 없음)
+            test_settings['NAME'] = os.path.join(tmp, 'load_test.sqlite3')
+            connection.close()
+            connection.creation.create_test_db(verbosity=0, autoclobber=True)
+            try:
+                generate_synthetic_dataset(
+                    words=options['words'], tuples=max(2 * options['writes'], 100),
+                    users=options['writers'], ratings=0,
+                )
+                return self.run_threads(options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+                test_settings['NAME'] = old_test_name
+
+    def run_threads(self, options):
+        workers = list(UserProfile.objects.order_by('user_id').values_list('user_id', 'dimension'))
+        tuples_by_dimension = {}
+        for tuple_id, dimension in WordTuple.objects.order_by('id').values_list('id', 'dimension'):
+            tuples_by_dimension.setdefault(dimension, []).append(tuple_id)
+        connection.close()
+
+        stats = {'writes': 0, 'locked': 0, 'errors': 0, 'reads': 0, 'read_errors': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def count(key):
+            with lock:
+                stats[key] += 1
+
+        def writer(user_id, dimension):
+            # rate_words POST와 같은 순서: 튜플 단어 조회, 중복 평가 확인, Rating.save (스레드마다 별도 연결)
+            # 가입 시 차원 배정(읽은 뒤 쓰는 atomic 블록)도 함께 실행
+            try:
+                for tuple_id in tuples_by_dimension[dimension][:options['writes']]:
+                    try:
+                        DimensionCounter.next_dimension()
+                        word_ids = list(WordTuple.words.through.objects.filter(
+                            wordtuple_id=tuple_id).values_list('word_id', flat=True))
+                        if Rating.objects.filter(user_id=user_id, word_tuple_id=tuple_id,
+                                                 dimension=dimension).exists():
+                            continue
+                        Rating.objects.create(
+                            user_id=user_id, word_tuple_id=tuple_id, dimension=dimension,
+                            best_word_id=word_ids[0], worst_word_id=word_ids[1], start_time=timezone.now(),
+                        )
+                        count('writes')  # 가입 차원 배정 + 평가 저장 한 쌍
+                    except OperationalError as e:
+                        count('locked' if 'locked' in str(e) else 'errors')
+                    except Exception:
+                        count('errors')
+            finally:
+                connection.close()
+
+        def reader():
+            # 관리자 대시보드 통계를 반복 계산
+            try:
+                while not stop.is_set():
+                    try:
+                        compute_dashboard_stats()
+                        count('reads')
+                    except Exception:
+                        count('read_errors')
+            finally:
+                connection.close()
+
+        readers = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        writers = [threading.Thread(target=writer, args=worker) for worker in workers]
+        started = time.perf_counter()
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        stats['elapsed'] = elapsed
+        stats['writes_per_sec'] = stats['writes'] / elapsed if elapsed else 0
+        return stats
@@ -0,0 +1,28 @@
+# vad_survey/management/commands/sync_rating_activity.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from vad_survey.gold import recount_gold_counters, sync_rating_activity, update_gold_accuracy
+from vad_survey.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Apply UserProfile.is_active to Rating.is_active in bulk (run periodically, e.g. from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recount-gold', action='store_true',
+                            help='Rebuild gold counters and accuracy for every profile before syncing')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['recount_gold']:
+                recount_gold_counters()
+                for user_id in UserProfile.objects.values_list('user_id', flat=True):
+                    update_gold_accuracy(user_id)
+                self.stdout.write("골든 카운터 및 정확도 재계산 완료")
+
+            deactivated, activated = sync_rating_activity()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"평가 활성 상태 동기화 완료 (비활성화 {deactivated}개, 활성화 {activated}개)"
+        ))
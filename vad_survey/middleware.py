@@ -0,0 +1,136 @@
+# vad_survey/middleware.py
+import math
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.db import connection
+
+# 뷰별로 보관할 최근 요청 수 (오래된 요청부터 버림)
+SAMPLE_SIZE = 1000
+# 가장 느린 SQL은 이 길이까지만 보관
+SLOWEST_SQL_LENGTH = 500
+
+
+class QueryRecorder:
+    """connection.execute_wrapper로 요청 중 실행된 쿼리 수, DB 시간, 가장 느린 SQL을 기록"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_sql = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            if elapsed > self.slowest_duration:
+                self.slowest_duration = elapsed
+                self.slowest_sql = sql
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값에서 nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class ViewMetrics:
+    """뷰 이름별 최근 SAMPLE_SIZE개 요청의 (전체 ms, DB ms, 쿼리 수)를 프로세스 메모리에 보관"""
+
+    def __init__(self, sample_size=SAMPLE_SIZE):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=sample_size))
+        self.slowest = {}
+
+    def record(self, view_name, total_ms, db_ms, queries, slowest_ms, slowest_sql):
+        with self.lock:
+            self.samples[view_name].append((total_ms, db_ms, queries))
+            if slowest_sql and slowest_ms >= self.slowest.get(view_name, {}).get('ms', 0):
+                self.slowest[view_name] = {'ms': round(slowest_ms, 2), 'sql': slowest_sql[:SLOWEST_SQL_LENGTH]}
+
+    def summary(self):
+        with self.lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+            slowest = dict(self.slowest)
+
+        result = {}
+        for name, values in sorted(samples.items()):
+            stats = {'requests': len(values)}
+            for index, key in enumerate(('total_ms', 'db_ms', 'queries')):
+                column = sorted(value[index] for value in values)
+                stats[key] = {
+                    f'p{int(fraction * 100)}': round(percentile(column, fraction), 2)
+                    for fraction in (0.5, 0.95, 0.99)
+                }
+                stats[key]['max'] = round(column[-1], 2)
+            stats['slowest_sql'] = slowest.get(name)
+            result[name] = stats
+        return result
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+            self.slowest.clear()
+
+
+METRICS = ViewMetrics()
+
+
+class RequestMetricsMiddleware:
+    """
+    요청마다 쿼리 수와 DB 시간을 재서 뷰별 히스토그램(METRICS)에 기록합니다.
+    백엔드 시간이 외부에 드러나지 않도록 Server-Timing 헤더는 DEBUG이거나 스태프 요청일 때만 붙입니다.
+    스트리밍 응답은 본문을 만들면서 쿼리가 실행되므로 본문을 끝까지 보낸 뒤에 기록합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        if response.streaming and not getattr(response, 'is_async', False):
+            # 헤더는 이미 확정되므로 Server-Timing 없이, 본문 전송이 끝날 때 기록
+            response.streaming_content = self.record_streaming(
+                request, response.streaming_content, recorder, started
+            )
+            return response
+
+        total_ms, db_ms = self.record(request, recorder, started)
+        if settings.DEBUG or getattr(getattr(request, 'user', None), 'is_staff', False):
+            response['Server-Timing'] = (
+                f'db;dur={db_ms:.1f};desc="{recorder.count} queries", app;dur={total_ms:.1f}'
+            )
+        return response
+
+    def record_streaming(self, request, content, recorder, started):
+        try:
+            with connection.execute_wrapper(recorder):
+                yield from content
+        finally:
+            self.record(request, recorder, started)
+
+    def record(self, request, recorder, started):
+        """METRICS에 기록하고 (전체 ms, DB ms)를 반환"""
+        total_ms = (time.perf_counter() - started) * 1000
+        db_ms = recorder.duration * 1000
+
+        match = request.resolver_match
+        view_name = (match.view_name or match._func_path) if match else 'unresolved'
+        METRICS.record(
+            view_name, total_ms, db_ms, recorder.count,
+            recorder.slowest_duration * 1000, recorder.slowest_sql,
+        )
+        return total_ms, db_ms
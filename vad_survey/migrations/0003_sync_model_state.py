@@ -0,0 +1,37 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0002_word_pos'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='personality_type',
+        ),
+        migrations.AddField(
+            model_name='rating',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='dimension',
+            field=models.CharField(blank=True, choices=[('V', 'Valence'), ('A', 'Arousal'), ('D', 'Dominance')], max_length=1, null=True),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='age',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='gender',
+            field=models.CharField(choices=[('M', '남성'), ('F', '여성')], max_length=10),
+        ),
+    ]
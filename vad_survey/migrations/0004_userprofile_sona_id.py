@@ -0,0 +1,46 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+def backfill_sona_id(apps, schema_editor):
+    """
+    기존 프로필의 sona_id를 채웁니다. 가입 시처럼 숫자 username을 쓰고,
+    숫자가 아니거나 이미 쓰인 값이면 기존 최대값 뒤의 번호를 차례로 부여합니다.
+    """
+    UserProfile = apps.get_model('vad_survey', 'UserProfile')
+    profiles = list(UserProfile.objects.select_related('user').order_by('id'))
+
+    used = set()
+    pending = []
+    for profile in profiles:
+        username = profile.user.username
+        if username.isdigit() and int(username) not in used:
+            profile.sona_id = int(username)
+            used.add(profile.sona_id)
+        else:
+            pending.append(profile)
+
+    next_id = max(used, default=0) + 1
+    for profile in pending:
+        profile.sona_id = next_id
+        next_id += 1
+
+    UserProfile.objects.bulk_update(profiles, ['sona_id'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0003_sync_model_state'),
+    ]
+
+    operations = [
+        # 기존 행이 모두 같은 기본값을 가지면 unique 제약에 걸리므로 null 허용으로 먼저 추가
+        migrations.AddField(
+            model_name='userprofile',
+            name='sona_id',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.RunPython(backfill_sona_id, migrations.RunPython.noop),
+    ]
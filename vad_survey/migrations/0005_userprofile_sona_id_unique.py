@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0004_userprofile_sona_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='sona_id',
+            field=models.PositiveIntegerField(default=0, unique=True),
+        ),
+    ]
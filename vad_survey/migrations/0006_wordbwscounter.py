@@ -0,0 +1,61 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:08
+
+from django.db import migrations, models
+from django.db.models import Count, F, Q
+import django.db.models.deletion
+
+
+def backfill_bws_counters(apps, schema_editor):
+    """기존 Rating을 (단어, 차원)별 best/worst/등장 횟수로 집계해 카운터를 채웁니다."""
+    WordTuple = apps.get_model('vad_survey', 'WordTuple')
+    WordBWSCounter = apps.get_model('vad_survey', 'WordBWSCounter')
+
+    rows = WordTuple.words.through.objects.filter(
+        wordtuple__rating__isnull=False,
+    ).values(
+        'word_id',
+        dimension=F('wordtuple__rating__dimension'),
+    ).annotate(
+        appearances=Count('wordtuple__rating'),
+        best=Count('wordtuple__rating', filter=Q(wordtuple__rating__best_word_id=F('word_id'))),
+        worst=Count('wordtuple__rating', filter=Q(wordtuple__rating__worst_word_id=F('word_id'))),
+    ).order_by()
+
+    WordBWSCounter.objects.bulk_create(
+        (
+            WordBWSCounter(
+                word_id=row['word_id'],
+                dimension=row['dimension'],
+                best_count=row['best'],
+                worst_count=row['worst'],
+                appearances=row['appearances'],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0005_userprofile_sona_id_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordBWSCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('V', 'Valence'), ('A', 'Arousal'), ('D', 'Dominance')], max_length=1)),
+                ('best_count', models.IntegerField(default=0)),
+                ('worst_count', models.IntegerField(default=0)),
+                ('appearances', models.IntegerField(default=0)),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bws_counters', to='vad_survey.word')),
+            ],
+            options={
+                'unique_together': {('word', 'dimension')},
+            },
+        ),
+        migrations.RunPython(backfill_bws_counters, migrations.RunPython.noop),
+    ]
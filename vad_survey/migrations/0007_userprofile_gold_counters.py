@@ -0,0 +1,47 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:12
+
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_gold_counters(apps, schema_editor):
+    Rating = apps.get_model('vad_survey', 'Rating')
+    UserProfile = apps.get_model('vad_survey', 'UserProfile')
+
+    gold_ratings = Rating.objects.filter(
+        user=OuterRef('user'), word_tuple__is_gold=True
+    ).order_by().values('user')
+
+    UserProfile.objects.update(
+        gold_rated_count=Coalesce(Subquery(
+            gold_ratings.annotate(c=Count('id')).values('c')
+        ), 0),
+        gold_correct_count=Coalesce(Subquery(
+            gold_ratings.annotate(c=Count('id', filter=Q(
+                best_word_id=F('word_tuple__gold_best_word_id'),
+                worst_word_id=F('word_tuple__gold_worst_word_id'),
+            ))).values('c')
+        ), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0006_wordbwscounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='gold_correct_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='gold_rated_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_gold_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:20
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_dimension(apps, schema_editor):
+    UserProfile = apps.get_model('vad_survey', 'UserProfile')
+    UserWordTuple = apps.get_model('vad_survey', 'UserWordTuple')
+
+    # 기존 작업자는 첫 할당 튜플의 차원을 사용
+    first_assignment = UserWordTuple.objects.filter(
+        user=OuterRef('user'), word_tuple__dimension__isnull=False
+    ).order_by('id').values('word_tuple__dimension')[:1]
+
+    UserProfile.objects.filter(dimension__isnull=True).update(
+        dimension=Subquery(first_assignment)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0007_userprofile_gold_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='dimension',
+            field=models.CharField(blank=True, choices=[('V', 'Valence'), ('A', 'Arousal'), ('D', 'Dominance')], max_length=1, null=True),
+        ),
+        migrations.RunPython(backfill_dimension, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:26
+
+from django.db import migrations, models
+
+
+def seed_counters(apps, schema_editor):
+    DimensionCounter = apps.get_model('vad_survey', 'DimensionCounter')
+    UserProfile = apps.get_model('vad_survey', 'UserProfile')
+
+    # 기존처럼 V, A를 번갈아 배정하고, 지금까지 배정된 작업자 수에서 이어서 셈
+    for dimension, weight in (('V', 1), ('A', 1), ('D', 0)):
+        DimensionCounter.objects.create(
+            dimension=dimension,
+            weight=weight,
+            assigned_count=UserProfile.objects.filter(dimension=dimension).count(),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0008_userprofile_dimension'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DimensionCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('V', 'Valence'), ('A', 'Arousal'), ('D', 'Dominance')], max_length=1, unique=True)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('assigned_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
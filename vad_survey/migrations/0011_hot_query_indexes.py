@@ -0,0 +1,25 @@
+# Generated by Django 4.2.17 on 2026-10-18 13:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vad_survey', '0010_dashboardsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['word_tuple', 'dimension'], name='rating_active_tuple_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userwordtuple',
+            index=models.Index(fields=['user', 'completed', 'word_tuple'], name='uwt_user_completed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wordtuple',
+            index=models.Index(fields=['dimension', 'is_gold'], name='wordtuple_dim_gold_idx'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import Count, Exists, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.validators import MinValueValidator
 
@@ -62,6 +64,9 @@ class Rating(models.Model):
         indexes = [
             models.Index(fields=['user', 'word_tuple', 'dimension']),
             models.Index(fields=['created_at']),
+            # 품질 필터링된 BWS 집계(is_active=True 평가만)용 부분 인덱스
+            models.Index(fields=['word_tuple', 'dimension'], condition=models.Q(is_active=True),
+                         name='rating_active_tuple_idx'),
         ]
 
     def clean(self):
@@ -95,35 +100,55 @@ class Rating(models.Model):
                     "response_time": "Response time is too long"
                 })
 
+    # 이보다 짧게 측정된 응답 시간은 이 값(ms)으로 기록
+    MIN_RESPONSE_TIME = 500
+
     def calculate_response_time(self):
         if self.start_time:
             time_diff = timezone.now() - self.start_time
-            self.response_time = int(time_diff.total_seconds() * 1000)
+            self.response_time = max(int(time_diff.total_seconds() * 1000), self.MIN_RESPONSE_TIME)
 
     def update_user_metrics(self):
-        profile = self.user.userprofile
-        profile.total_ratings += 1
-        profile.last_rating_at = self.created_at
-        profile.save()
+        UserProfile.objects.filter(user_id=self.user_id).update(
+            total_ratings=F('total_ratings') + 1,
+            last_rating_at=self.created_at,
+        )
 
     def update_word_metrics(self):
-        self.best_word.total_ratings += 1
-        self.worst_word.total_ratings += 1
-        self.best_word.save()
-        self.worst_word.save()
+        Word.objects.filter(id__in=[self.best_word_id, self.worst_word_id]).update(
+            total_ratings=F('total_ratings') + 1
+        )
+
+    def update_bws_counters(self):
+        WordBWSCounter.apply_rating(self, 1)
 
     def save(self, *args, **kwargs):
-        self.calculate_response_time()
+        adding = self._state.adding
+        if adding:
+            self.calculate_response_time()
 
         if self.pk is not None:
             self.clean()
 
-        super().save(*args, **kwargs)
+        if adding:
+            # 새 평가는 작업자의 현재 활성 상태를 따름 (기존 평가는 sync_rating_activity로 일괄 반영)
+            # 쓰기 트랜잭션이 읽기로 시작하지 않도록 트랜잭션을 열기 전에 읽음
+            self.is_active = UserProfile.objects.filter(
+                user_id=self.user_id
+            ).values_list('is_active', flat=True).first() is not False
+
+        # 평가 저장과 집계 갱신을 하나의 트랜잭션으로 처리 (INSERT로 시작, 집계는 F()/upsert로 원자적 증가)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
-        self.update_user_metrics()
-        self.update_word_metrics()
+            if adding:
+                self.update_user_metrics()
+                self.update_word_metrics()
+                self.update_bws_counters()
 
-        self.word_tuple.check_completion()
+        if adding:
+            # 할당 완료 표시는 평가에서 유도되는 상태이므로 커밋 후 갱신 (어긋나면 reconcile_completion)
+            self.word_tuple.check_completion(user=self.user_id)
 
     def __str__(self):
         return (f"{self.user.username}'s {self.get_dimension_display()} "
@@ -155,6 +180,12 @@ class WordTuple(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 차원별 골든/일반 튜플 조회 (할당, 통계)
+            models.Index(fields=['dimension', 'is_gold'], name='wordtuple_dim_gold_idx'),
+        ]
+
     def __str__(self):
         word_list = [w.text for w in self.words.all()]
         return f"Tuple {self.id}: " + ", ".join(word_list)
@@ -169,26 +200,25 @@ class WordTuple(models.Model):
     def is_fully_rated_by_user(self, user):
         return not bool(self.get_missing_dimensions(user))
 
-    def check_completion(self):
+    def check_completion(self, user=None):
         """
-        이 튜플에 대한 모든 평가가 완료되었는지 확인합니다.
+        이 튜플의 차원에 대해 평가가 있는 미완료 할당을 한 번의 UPDATE로 완료 처리합니다.
+        user를 지정하면 해당 작업자의 할당만 확인합니다.
         """
-        # 이 튜플과 연결된 모든 UserWordTuple 확인
-        user_tuples = UserWordTuple.objects.filter(word_tuple=self)
+        if not self.dimension:  # dimension이 설정된 경우만 확인
+            return 0
 
-        for user_tuple in user_tuples:
-            # 해당 사용자가 이 튜플의 차원에 대해 평가했는지 확인
-            if self.dimension:  # dimension이 설정된 경우만 확인
-                is_rated = Rating.objects.filter(
-                    user=user_tuple.user,
-                    word_tuple=self,
-                    dimension=self.dimension
-                ).exists()
+        user_tuples = UserWordTuple.objects.filter(word_tuple=self, completed=False)
+        if user is not None:
+            user_tuples = user_tuples.filter(user=user)
 
-                # 평가되었으면 completed 플래그 설정
-                if is_rated and not user_tuple.completed:
-                    user_tuple.completed = True
-                    user_tuple.save(update_fields=['completed'])
+        return user_tuples.filter(
+            Exists(Rating.objects.filter(
+                user=OuterRef('user'),
+                word_tuple=self,
+                dimension=self.dimension,
+            ))
+        ).update(completed=True)
 
 
 class UserProfile(models.Model):
@@ -200,9 +230,14 @@ class UserProfile(models.Model):
     ])
     age = models.PositiveIntegerField(default=0)
     gold_accuracy = models.FloatField(default=0.0)
+    # 골든 튜플 평가 누적 카운터 (정확도 계산용, Rating 생성/삭제 시 F()로 증감)
+    gold_rated_count = models.IntegerField(default=0)
+    gold_correct_count = models.IntegerField(default=0)
     total_ratings = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
     last_rating_at = models.DateTimeField(null=True, blank=True)
+    # 작업자가 평가할 차원 (가입 시 결정, lazy 할당에서 튜플을 고를 때 사용)
+    dimension = models.CharField(max_length=1, choices=Rating.DIMENSIONS, null=True, blank=True)
 
     def __str__(self):
         return f"{self.user.username}"
@@ -228,7 +263,8 @@ class UserProfile(models.Model):
         pass
 
     def delete(self, *args, **kwargs):
-        self.user.delete()  # 연결된 User도 같이 삭제
+        # 연결된 User도 같이 삭제 (평가와 카운터 정리는 User pre_delete 시그널에서)
+        self.user.delete()
         super().delete(*args, **kwargs)
 
 
@@ -240,6 +276,10 @@ class UserWordTuple(models.Model):
 
     class Meta:
         unique_together = ('user', 'word_tuple')
+        indexes = [
+            # 작업자의 미완료 할당 선택과 진행률 집계를 인덱스만으로 처리
+            models.Index(fields=['user', 'completed', 'word_tuple'], name='uwt_user_completed_idx'),
+        ]
 
     def is_fully_rated(self):
         rated_dimensions = Rating.objects.filter(
@@ -250,4 +290,135 @@ class UserWordTuple(models.Model):
 
     def __str__(self):
         word_list = ", ".join([w.text for w in self.word_tuple.words.all()])
-        return f"{self.user.username} - [{word_list}]"
\ No newline at end of file
+        return f"{self.user.username} - [{word_list}]"
+
+
+class WordBWSCounter(models.Model):
+    """
+    단어·차원별 BWS 누적 카운터.
+    Rating 생성 시 F() 증가로, 삭제 시 discount_ratings의 집합 UPDATE로 갱신되며,
+    is_active와 무관하게 모든 평가를 누적합니다.
+    (품질 필터링된 점수는 compute_bws_scores로 계산)
+    """
+    word = models.ForeignKey(Word, on_delete=models.CASCADE, related_name='bws_counters')
+    dimension = models.CharField(max_length=1, choices=Rating.DIMENSIONS)
+    best_count = models.IntegerField(default=0)
+    worst_count = models.IntegerField(default=0)
+    appearances = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('word', 'dimension')
+
+    @property
+    def score(self):
+        if not self.appearances:
+            return None
+        return (self.best_count - self.worst_count) / self.appearances
+
+    @classmethod
+    def apply_rating(cls, rating, delta):
+        """
+        평가 하나를 튜플의 모든 단어 카운터에 반영 (delta=1: 생성, -1: 삭제).
+        튜플 단어를 미리 읽지 않고 INSERT ... SELECT ... ON CONFLICT DO UPDATE 한 문장으로
+        없는 카운터는 만들고 있는 카운터는 증감합니다 (SQLite 3.24+, PostgreSQL).
+        """
+        quote = connection.ops.quote_name
+        table = quote(cls._meta.db_table)
+        through = quote(WordTuple.words.through._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (word_id, dimension, best_count, worst_count, appearances) "
+                f"SELECT word_id, %s, "
+                f"CASE WHEN word_id = %s THEN %s ELSE 0 END, "
+                f"CASE WHEN word_id = %s THEN %s ELSE 0 END, %s "
+                f"FROM {through} WHERE wordtuple_id = %s "
+                f"ON CONFLICT (word_id, dimension) DO UPDATE SET "
+                f"best_count = {table}.best_count + excluded.best_count, "
+                f"worst_count = {table}.worst_count + excluded.worst_count, "
+                f"appearances = {table}.appearances + excluded.appearances",
+                [rating.dimension, rating.best_word_id, delta, rating.worst_word_id, delta, delta,
+                 rating.word_tuple_id],
+            )
+
+    @classmethod
+    def discount_ratings(cls, ratings):
+        """
+        지울 평가들(queryset)을 튜플 단어 카운터에서 한 번의 UPDATE로 차감합니다 (평가를 지우기 전에 호출).
+        단어·차원별 차감량을 상관 서브쿼리로 세므로 평가 수와 무관하게 쿼리 하나입니다.
+        """
+        matching = ratings.filter(
+            word_tuple__words=OuterRef('word'), dimension=OuterRef('dimension')
+        ).order_by().values('dimension')
+
+        def count(queryset):
+            return Coalesce(Subquery(queryset.annotate(c=Count('id')).values('c')), 0)
+
+        affected_words = WordTuple.words.through.objects.filter(
+            wordtuple__rating__in=ratings
+        ).values('word_id')
+        return cls.objects.filter(word__in=affected_words).update(
+            appearances=F('appearances') - count(matching),
+            best_count=F('best_count') - count(matching.filter(best_word=OuterRef('word'))),
+            worst_count=F('worst_count') - count(matching.filter(worst_word=OuterRef('word'))),
+        )
+
+    def __str__(self):
+        return f"{self.word} ({self.dimension})"
+
+
+class DimensionCounter(models.Model):
+    """
+    가입 시 작업자에게 배정할 차원을 고르는 차원별 카운터.
+    assigned_count / weight가 가장 작은 차원을 고르므로 weight 비율대로 배정됩니다 (weight 0이면 배정 안 함).
+    """
+    # 테이블이 비어 있을 때 사용할 기본 가중치 (기존처럼 V, A를 번갈아 배정)
+    DEFAULT_WEIGHTS = {'V': 1, 'A': 1, 'D': 0}
+
+    dimension = models.CharField(max_length=1, choices=Rating.DIMENSIONS, unique=True)
+    weight = models.PositiveIntegerField(default=1)
+    assigned_count = models.IntegerField(default=0)
+
+    @classmethod
+    def next_dimension(cls):
+        """
+        다음 차원을 골라 카운터를 1 올리고 반환합니다. 활성 차원이 없으면 None.
+        조건부 F() UPDATE로 동시 가입에도 같은 카운트 값을 두 번 쓰지 않으며, 경합 시 다시 고릅니다.
+        """
+        while True:
+            with transaction.atomic():
+                counters = list(
+                    cls.objects.select_for_update().filter(weight__gt=0).order_by('id')
+                )
+                if not counters:
+                    if cls.objects.exists():
+                        return None
+                    cls.objects.bulk_create(
+                        [cls(dimension=dimension, weight=weight)
+                         for dimension, weight in cls.DEFAULT_WEIGHTS.items()],
+                        ignore_conflicts=True,
+                    )
+                    continue
+                chosen = min(counters, key=lambda c: c.assigned_count / c.weight)
+                updated = cls.objects.filter(
+                    pk=chosen.pk, assigned_count=chosen.assigned_count
+                ).update(assigned_count=F('assigned_count') + 1)
+            if updated:
+                return chosen.dimension
+
+    def __str__(self):
+        return f"{self.dimension} (weight {self.weight}, {self.assigned_count})"
+
+
+class DashboardSnapshot(models.Model):
+    """
+    관리자 대시보드 통계 스냅샷 (한 행).
+    refresh_dashboard_stats 명령으로 주기적으로 갱신하고, 대시보드는 이 행만 읽습니다.
+    """
+    SINGLETON_ID = 1
+
+    data = models.JSONField(default=dict)
+    compute_seconds = models.FloatField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Dashboard snapshot ({self.refreshed_at:%Y-%m-%d %H:%M})"
@@ -0,0 +1,170 @@
+# vad_survey/reliability.py
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .models import Rating, WordTuple
+
+
+def load_shr_data(dimension):
+    """
+    SHR 계산에 필요한 배열을 한 번에 적재합니다.
+    평가별 튜플 그룹, best/worst 단어 인덱스, 평가-단어 등장(flat) 배열을 반환합니다.
+    """
+    ratings = np.array(
+        list(Rating.objects.filter(dimension=dimension, is_active=True).values_list(
+            'word_tuple_id', 'best_word_id', 'worst_word_id'
+        )),
+        dtype=np.int64,
+    ).reshape(-1, 3)
+    links = np.array(
+        list(WordTuple.words.through.objects.filter(wordtuple__dimension=dimension).values_list(
+            'wordtuple_id', 'word_id'
+        )),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    # 평가가 없는 튜플의 단어는 점수도 없으므로 제외 (단어 수는 평가된 단어만 셈)
+    links = links[np.isin(links[:, 0], ratings[:, 0])]
+
+    # 연결 행을 튜플 id 순으로 정렬하고 튜플별 시작 위치·단어 수 계산
+    links = links[np.argsort(links[:, 0], kind='stable')]
+    tuple_ids, link_start, link_count = np.unique(links[:, 0], return_index=True, return_counts=True)
+
+    # 튜플-단어 연결이 없는 평가는 제외
+    ratings = ratings[np.isin(ratings[:, 0], tuple_ids)]
+    rating_tuple = np.searchsorted(tuple_ids, ratings[:, 0])
+
+    # 단어 id → 0..W-1 밀집 인덱스
+    word_ids, word_index = np.unique(
+        np.concatenate([links[:, 1], ratings[:, 1], ratings[:, 2]]), return_inverse=True
+    )
+    link_word = word_index[:len(links)]
+    best = word_index[len(links):len(links) + len(ratings)]
+    worst = word_index[len(links) + len(ratings):]
+
+    # 평가 하나가 튜플의 모든 단어에 한 번씩 등장하도록 펼침
+    per_rating = link_count[rating_tuple]
+    appearance_rating = np.repeat(np.arange(len(ratings)), per_rating)
+    offsets = np.arange(per_rating.sum()) - np.repeat(np.cumsum(per_rating) - per_rating, per_rating)
+    appearance_word = link_word[np.repeat(link_start[rating_tuple], per_rating) + offsets]
+
+    return {
+        'word_ids': word_ids,
+        'rating_tuple': rating_tuple,
+        'best': best,
+        'worst': worst,
+        'appearance_rating': appearance_rating,
+        'appearance_word': appearance_word,
+    }
+
+
+def rankdata(values):
+    """동순위는 평균 순위로 처리하는 순위 계산 (Spearman 용)"""
+    order = np.argsort(values, kind='mergesort')
+    sorted_values = values[order]
+    boundaries = np.flatnonzero(np.diff(sorted_values)) + 1
+    starts = np.concatenate([[0], boundaries])
+    ends = np.concatenate([boundaries, [len(values)]])
+    ranks = np.empty(len(values), dtype=np.float64)
+    ranks[order] = np.repeat((starts + ends + 1) / 2, ends - starts)
+    return ranks
+
+
+def pearson(x, y):
+    """Pearson 상관. 값이 두 개 미만이거나 한쪽이 상수이면 정의되지 않으므로 nan"""
+    if len(x) < 2 or np.ptp(x) == 0 or np.ptp(y) == 0:
+        return float('nan')
+    return float(np.corrcoef(x, y)[0, 1])
+
+
+def half_scores(data, mask):
+    """선택된 평가(mask)만으로 단어별 BWS counting 점수와 등장 횟수 계산"""
+    num_words = len(data['word_ids'])
+    best = np.bincount(data['best'][mask], minlength=num_words)
+    worst = np.bincount(data['worst'][mask], minlength=num_words)
+    appearances = np.bincount(
+        data['appearance_word'][mask[data['appearance_rating']]], minlength=num_words
+    )
+    # 이 절반에 등장하지 않은 단어는 점수 없음(nan)
+    scores = np.divide(best - worst, appearances, out=np.full(num_words, np.nan), where=appearances > 0)
+    return scores, appearances
+
+
+def shr_trial(data, rng):
+    """튜플별 평가를 무작위 두 그룹으로 나누어 두 점수 간 (Spearman, Pearson) 반환"""
+    rating_tuple = data['rating_tuple']
+    num_ratings = len(rating_tuple)
+
+    # 튜플 순, 튜플 안에서는 무작위 순으로 정렬 (정수 + [0, 1) 난수 하나로 정렬)
+    order = np.argsort(rating_tuple + rng.random(num_ratings))
+    sorted_tuple = rating_tuple[order]
+    group_start = np.flatnonzero(np.r_[True, sorted_tuple[1:] != sorted_tuple[:-1]])
+    group_size = np.diff(np.r_[group_start, num_ratings])
+    group = np.repeat(np.arange(len(group_start)), group_size)
+    position = np.arange(num_ratings) - group_start[group]
+
+    # 앞쪽 절반을 A로, 홀수 개일 때 남는 하나는 무작위로 A/B 중 한쪽에 배정
+    first_half = position * 2 < group_size[group]
+    flip = rng.random(len(group_start)) < 0.5
+    in_a = np.empty(num_ratings, dtype=bool)
+    in_a[order] = first_half ^ flip[group]
+
+    scores_a, appearances_a = half_scores(data, in_a)
+    scores_b, appearances_b = half_scores(data, ~in_a)
+    both = (appearances_a > 0) & (appearances_b > 0)
+    scores_a, scores_b = scores_a[both], scores_b[both]
+
+    return pearson(rankdata(scores_a), rankdata(scores_b)), pearson(scores_a, scores_b)
+
+
+_worker_data = None
+
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _run_trials(seeds, data=None):
+    data = _worker_data if data is None else data
+    return [shr_trial(data, np.random.default_rng(seed)) for seed in seeds]
+
+
+def summarize(values):
+    """nan(상관을 정의할 수 없던 시행)을 뺀 평균과 표준편차. 남은 시행이 없으면 nan"""
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return float('nan'), float('nan')
+    return float(values.mean()), float(values.std())
+
+
+def split_half_reliability(data, trials=100, random_seed=1234, workers=1):
+    """
+    N회 split-half 시행의 평균 Spearman/Pearson 상관을 계산합니다.
+    시행별 시드는 random_seed에서 파생되므로 작업자 수와 관계없이 결과가 같습니다.
+    두 절반 모두에 등장한 단어가 부족해 상관을 계산할 수 없는 시행은 평균에서 제외합니다.
+    """
+    seeds = np.random.SeedSequence(random_seed).spawn(trials)
+
+    if workers > 1 and trials > 1:
+        chunk_size = -(-trials // workers)
+        chunks = [seeds[i:i + chunk_size] for i in range(0, trials, chunk_size)]
+        with ProcessPoolExecutor(max_workers=len(chunks), initializer=_init_worker, initargs=(data,)) as executor:
+            results = [result for chunk in executor.map(_run_trials, chunks) for result in chunk]
+    else:
+        results = _run_trials(seeds, data)
+
+    correlations = np.array(results, dtype=np.float64).reshape(-1, 2)
+    spearman, spearman_std = summarize(correlations[:, 0])
+    pearson_mean, pearson_std = summarize(correlations[:, 1])
+    return {
+        'trials': trials,
+        'valid_trials': int(np.count_nonzero(~np.isnan(correlations[:, 1]))),
+        'ratings': len(data['rating_tuple']),
+        'words': len(data['word_ids']),
+        'spearman': spearman,
+        'spearman_std': spearman_std,
+        'pearson': pearson_mean,
+        'pearson_std': pearson_std,
+    }
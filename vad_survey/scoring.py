@@ -0,0 +1,96 @@
+# vad_survey/scoring.py
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from .models import Word, WordBWSCounter, WordTuple
+
+# 차원 코드 → Word 점수 필드
+SCORE_FIELDS = {
+    'V': 'valence_score',
+    'A': 'arousal_score',
+    'D': 'dominance_score',
+}
+
+
+def bws_counts(dimensions=None, active_only=True):
+    """
+    활성(is_active=True) 평가를 (단어, 차원)별 best/worst/등장 횟수로 집계합니다.
+    튜플-단어 연결 테이블과 Rating을 조인한 한 번의 GROUP BY 쿼리로 계산합니다.
+    """
+    # 다중값 관계이므로 조건을 한 번의 filter()에 모아 같은 Rating 조인을 재사용
+    conditions = {'wordtuple__rating__isnull': False}
+    if active_only:
+        conditions['wordtuple__rating__is_active'] = True
+    if dimensions:
+        conditions['wordtuple__rating__dimension__in'] = dimensions
+    links = WordTuple.words.through.objects.filter(**conditions)
+
+    return links.values(
+        'word_id',
+        dimension=F('wordtuple__rating__dimension'),
+    ).annotate(
+        appearances=Count('wordtuple__rating'),
+        best=Count('wordtuple__rating', filter=Q(wordtuple__rating__best_word_id=F('word_id'))),
+        worst=Count('wordtuple__rating', filter=Q(wordtuple__rating__worst_word_id=F('word_id'))),
+    ).order_by()
+
+
+def bws_score(best, worst, appearances):
+    """BWS counting 점수: (best - worst) / 등장 횟수, 범위 [-1, 1]"""
+    if not appearances:
+        return None
+    return (best - worst) / appearances
+
+
+def compute_bws_scores(dimensions=None, batch_size=1000):
+    """
+    BWS counting 점수를 계산해 Word.valence_score/arousal_score/dominance_score에 저장합니다.
+    평가가 없는 단어의 점수는 건드리지 않습니다. 차원별 갱신된 단어 수를 반환합니다.
+    """
+    dimensions = list(dimensions or SCORE_FIELDS)
+    scores = {dimension: [] for dimension in dimensions}
+
+    for row in bws_counts(dimensions).iterator():
+        score = bws_score(row['best'], row['worst'], row['appearances'])
+        scores[row['dimension']].append(Word(pk=row['word_id'], **{SCORE_FIELDS[row['dimension']]: score}))
+
+    with transaction.atomic():
+        for dimension, words in scores.items():
+            # 차원별로 해당 점수 필드만 갱신 (Word 행을 읽지 않음)
+            Word.objects.bulk_update(words, [SCORE_FIELDS[dimension]], batch_size=batch_size)
+
+    return {dimension: len(words) for dimension, words in scores.items()}
+
+
+def rebuild_bws_counters(batch_size=1000):
+    """전체 Rating에서 WordBWSCounter를 다시 만듭니다 (기존 데이터 백필 및 감사용)"""
+    counters = [
+        WordBWSCounter(
+            word_id=row['word_id'],
+            dimension=row['dimension'],
+            best_count=row['best'],
+            worst_count=row['worst'],
+            appearances=row['appearances'],
+        )
+        for row in bws_counts(active_only=False).iterator()
+    ]
+
+    with transaction.atomic():
+        WordBWSCounter.objects.all().delete()
+        WordBWSCounter.objects.bulk_create(counters, batch_size=batch_size)
+
+    return len(counters)
+
+
+def live_scores(dimension, word_ids=None):
+    """누적 카운터에서 {word_id: 점수}를 바로 읽습니다 (단어당 O(1))"""
+    counters = WordBWSCounter.objects.filter(dimension=dimension, appearances__gt=0)
+    if word_ids is not None:
+        counters = counters.filter(word_id__in=word_ids)
+
+    return {
+        word_id: bws_score(best, worst, appearances)
+        for word_id, best, worst, appearances in counters.values_list(
+            'word_id', 'best_count', 'worst_count', 'appearances'
+        )
+    }
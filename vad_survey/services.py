@@ -0,0 +1,140 @@
+# vad_survey/services.py
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from .assignment import assignment_setting, draw_next_tuples
+from .gold import recount_gold_counters, update_gold_accuracy
+from .models import Rating, UserProfile, UserWordTuple, Word, WordBWSCounter
+
+SESSION_TUPLE_KEY = 'current_rating_tuple_id'
+
+
+def rated_subquery():
+    """할당(UserWordTuple)의 튜플 차원에 대해 이미 평가가 있는지 확인하는 서브쿼리"""
+    return Rating.objects.filter(
+        user=OuterRef('user'),
+        word_tuple=OuterRef('word_tuple'),
+        dimension=OuterRef('word_tuple__dimension'),
+    )
+
+
+def pick_next_user_tuple(user):
+    """
+    평가 가능한(미완료, 차원 지정, 아직 평가 안 한) 할당 하나를 한 번의 쿼리로 무작위 선택합니다.
+    """
+    return UserWordTuple.objects.filter(
+        user=user,
+        completed=False,
+        word_tuple__dimension__isnull=False,
+    ).filter(
+        ~Exists(rated_subquery())
+    ).select_related('word_tuple').order_by('?').first()
+
+
+def mark_rated_as_completed(user=None):
+    """이미 평가했지만 completed가 아닌 할당을 한 번의 UPDATE로 완료 처리 (user가 없으면 전체)"""
+    user_tuples = UserWordTuple.objects.filter(completed=False)
+    if user is not None:
+        user_tuples = user_tuples.filter(user=user)
+
+    return user_tuples.filter(
+        Exists(rated_subquery())
+    ).update(completed=True)
+
+
+def get_current_user_tuple(request):
+    """
+    세션에 저장된 현재 평가 튜플을 반환하고, 없으면 새로 선택하여 세션에 저장합니다.
+    평가할 튜플이 없으면 남은 할당을 정리하고 None을 반환합니다.
+    """
+    current_tuple_id = request.session.get(SESSION_TUPLE_KEY)
+
+    if current_tuple_id:
+        try:
+            return UserWordTuple.objects.select_related('word_tuple').get(
+                id=current_tuple_id,
+                user=request.user,
+                completed=False
+            )
+        except UserWordTuple.DoesNotExist:
+            # 세션에 저장된 튜플이 없거나 이미 완료된 경우 세션에서 제거
+            del request.session[SESSION_TUPLE_KEY]
+
+    user_tuple = pick_next_user_tuple(request.user)
+    if user_tuple is None and assignment_setting('MODE') == 'lazy':
+        # lazy 모드: 평가할 튜플이 떨어졌을 때만 새로 할당
+        if draw_next_tuples(request.user):
+            user_tuple = pick_next_user_tuple(request.user)
+    if user_tuple is None:
+        mark_rated_as_completed(request.user)
+        return None
+
+    request.session[SESSION_TUPLE_KEY] = user_tuple.id
+    return user_tuple
+
+
+def get_user_progress(user):
+    """작업자의 할당 진행 현황(전체/완료/남은 수, 진행률)을 한 번의 집계 쿼리로 계산"""
+    progress = UserWordTuple.objects.filter(user=user).aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(completed=True)),
+    )
+    if assignment_setting('MODE') == 'lazy':
+        # lazy 모드에서는 아직 할당되지 않은 몫까지 전체 수에 포함
+        progress['total'] = max(progress['total'], assignment_setting('QUOTA'))
+    progress['left'] = progress['total'] - progress['completed']
+    progress['rate'] = progress['completed'] / progress['total'] * 100 if progress['total'] else 0
+    return progress
+
+
+def recount_rating_totals(word_ids=(), user_ids=()):
+    """
+    주어진 단어와 작업자의 total_ratings를 Rating에서 다시 세어
+    각각 한 번의 UPDATE ... SET total_ratings = (SELECT COUNT ...)로 갱신합니다.
+    """
+    best = Rating.objects.filter(best_word=OuterRef('pk')).order_by().values('best_word')
+    worst = Rating.objects.filter(worst_word=OuterRef('pk')).order_by().values('worst_word')
+    words_updated = Word.objects.filter(id__in=word_ids).update(
+        # best와 worst는 항상 다른 단어이므로 두 개수의 합이 단어가 포함된 평가 수
+        total_ratings=Coalesce(Subquery(best.annotate(c=Count('id')).values('c')), 0)
+        + Coalesce(Subquery(worst.annotate(c=Count('id')).values('c')), 0)
+    )
+
+    user_ratings = Rating.objects.filter(user=OuterRef('user')).order_by().values('user')
+    profiles_updated = UserProfile.objects.filter(user_id__in=user_ids).update(
+        total_ratings=Coalesce(Subquery(user_ratings.annotate(c=Count('id')).values('c')), 0)
+    )
+    return words_updated, profiles_updated
+
+
+def delete_ratings(ratings):
+    """
+    평가들(queryset)을 지우고 BWS 카운터, total_ratings, 골든 카운터를 집합 단위로 맞춥니다.
+    Rating에는 삭제 시그널이 없으므로 평가를 지우는 경로는 이 함수를 거쳐야 카운터가 어긋나지 않습니다.
+    삭제된 평가 수를 반환합니다.
+    """
+    with transaction.atomic():
+        affected_words = set()
+        affected_users = set()
+        gold_users = set()
+        for best_id, worst_id, user_id, is_gold in ratings.values_list(
+            'best_word_id', 'worst_word_id', 'user_id', 'word_tuple__is_gold'
+        ):
+            affected_words.update((best_id, worst_id))
+            affected_users.add(user_id)
+            if is_gold:
+                gold_users.add(user_id)
+        if not affected_users:
+            return 0
+
+        # 평가가 남아 있을 때 단어 카운터를 차감한 뒤 삭제 (시그널이 없어 한 번의 DELETE)
+        WordBWSCounter.discount_ratings(ratings)
+        deleted = ratings.delete()[0]
+
+        recount_rating_totals(affected_words, affected_users)
+        if gold_users:
+            recount_gold_counters(gold_users)
+            for user_id in gold_users:
+                update_gold_accuracy(user_id)
+    return deleted
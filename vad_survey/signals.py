@@ -1,75 +1,52 @@
-import random
-from django.db.models.signals import post_save, post_delete
+from django.contrib.auth.models import User
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
-from django.db.models import F
-from .models import UserProfile, WordTuple, UserWordTuple, Rating
+from .assignment import assign_on_signup, assignment_setting
+from .db import apply_sqlite_pragmas, apply_sqlite_transaction_mode
+from .gold import record_gold_rating
+from .models import DimensionCounter, UserProfile, Rating
+from .services import delete_ratings
 
 
 @receiver(post_save, sender=UserProfile)
 def assign_alternating_dimension_wordtuples(sender, instance, created, **kwargs):
-    """회원가입 시 V, A 차원을 번갈아가며 순차적으로 100개 튜플 할당"""
+    """
+    회원가입 시 DimensionCounter의 가중치에 따라 차원을 배정합니다.
+    eager 모드에서만 튜플을 바로 할당하고, lazy 모드에서는 평가 페이지 요청 시 할당합니다.
+    """
     if not created:
         return
 
-    user = instance.user
-    target_count = 100
-    user_count = UserProfile.objects.count()
-    dimension = 'V' if user_count % 2 == 1 else 'A'
-
-    tuples = list(WordTuple.objects.filter(dimension=dimension))
-    random.shuffle(tuples)
-    selected_tuples = tuples[:target_count]
-
-    for word_tuple in selected_tuples:
-        UserWordTuple.objects.get_or_create(user=user, word_tuple=word_tuple)
-
-
-def recalculate_gold_accuracy(user):
-    """골든 정확도 재계산 함수"""
-    profile = user.userprofile
-
-    # 평가 완료된 골든 튜플 수
-    rated_gold = Rating.objects.filter(user=user, word_tuple__is_gold=True).values('word_tuple').distinct().count()
-
-    # 할당된 골든 튜플 수
-    assigned_gold = UserWordTuple.objects.filter(user=user, word_tuple__is_gold=True).count()
-
-    if rated_gold == 0 or rated_gold < assigned_gold:
-        # 평가 미완료이거나 평가 0개이면 정확도 계산하지 않음
+    # 차원별 카운터와 가중치로 배정 (기본: V, A 번갈아)
+    dimension = DimensionCounter.next_dimension()
+    if dimension is None:
         return
+    UserProfile.objects.filter(pk=instance.pk).update(dimension=dimension)
+    instance.dimension = dimension
 
-    # 정확히 일치하는 골든 평가 수
-    correct_count = Rating.objects.filter(
-        user=user,
-        word_tuple__is_gold=True,
-        best_word_id=F('word_tuple__gold_best_word_id'),
-        worst_word_id=F('word_tuple__gold_worst_word_id'),
-    ).count()
+    if assignment_setting('MODE') == 'eager':
+        assign_on_signup(instance.user, dimension)
 
-    # 정확도 계산
-    accuracy = (correct_count / rated_gold) * 100
-    profile.gold_accuracy = accuracy
 
-    # 정확도에 따라 활성/비활성 설정
-    if accuracy < 80:
-        profile.is_active = False
-        Rating.objects.filter(user=user).update(is_active=False)
-    else:
-        profile.is_active = True
-        Rating.objects.filter(user=user).update(is_active=True)
+@receiver(post_save, sender=Rating)
+def handle_rating_save(sender, instance, created, **kwargs):
+    """Rating 생성 시 골든 카운터 증가 및 정확도 갱신"""
+    if created and instance.word_tuple.is_gold:
+        record_gold_rating(instance, 1)
 
-    profile.save()
 
+@receiver(pre_delete, sender=User)
+def delete_user_ratings(sender, instance, **kwargs):
+    """User 삭제가 평가로 cascade되기 전에 delete_ratings로 지워 단어 카운터와 골든 카운터를 맞춤"""
+    delete_ratings(Rating.objects.filter(user=instance))
 
-@receiver(post_save, sender=Rating)
-def handle_rating_save(sender, instance, **kwargs):
-    """Rating 저장 시 골든 정확도 재계산"""
-    if instance.word_tuple.is_gold:
-        recalculate_gold_accuracy(instance.user)
 
-
-@receiver(post_delete, sender=Rating)
-def handle_rating_delete(sender, instance, **kwargs):
-    """Rating 삭제 시 골든 정확도 재계산"""
-    if instance.word_tuple.is_gold:
-        recalculate_gold_accuracy(instance.user)
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """SQLite 연결이 열릴 때 WAL, busy_timeout 등 운영용 PRAGMA와 트랜잭션 시작 모드(BEGIN IMMEDIATE) 적용"""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        apply_sqlite_pragmas(cursor)
+    apply_sqlite_transaction_mode(connection)
@@ -0,0 +1,119 @@
+# vad_survey/synthetic.py
+import random
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .dashboard import refresh_dashboard_stats
+from .gold import recount_gold_counters
+from .models import DimensionCounter, Rating, UserProfile, UserWordTuple, Word, WordTuple
+from .scoring import rebuild_bws_counters
+from .services import recount_rating_totals
+
+# 합성 데이터에서 작업자에게 배정하는 차원
+SYNTHETIC_DIMENSIONS = ('V', 'A')
+# 작업자마다 평가하지 않은 채로 남겨 둘 할당 수 (평가 페이지가 빈 상태가 되지 않도록)
+PENDING_PER_USER = 20
+
+
+def generate_synthetic_dataset(words=20000, tuples=40000, users=1000, ratings=1000000,
+                               items_per_tuple=4, gold_ratio=0.01, random_seed=1234, batch_size=5000):
+    """
+    벤치마크용 합성 어휘·튜플·작업자·할당·평가 데이터를 bulk_create로 만듭니다.
+    Rating.save와 시그널을 거치지 않으므로 마지막에 파생 카운터와 대시보드 스냅샷을 다시 계산합니다.
+    생성된 행 수를 dict로 반환합니다.
+    """
+    rng = random.Random(random_seed)
+
+    with transaction.atomic():
+        Word.objects.bulk_create(
+            (Word(text=f"단어{i}", POS='N') for i in range(words)), batch_size=batch_size
+        )
+        word_ids = list(Word.objects.order_by('id').values_list('id', flat=True))
+
+        # 튜플: 차원을 번갈아 배정하고, 일부는 첫 두 단어를 정답으로 하는 골든 튜플
+        tuple_words = [rng.sample(word_ids, items_per_tuple) for _ in range(tuples)]
+        tuple_objs = []
+        for i, members in enumerate(tuple_words):
+            is_gold = rng.random() < gold_ratio
+            tuple_objs.append(WordTuple(
+                dimension=SYNTHETIC_DIMENSIONS[i % len(SYNTHETIC_DIMENSIONS)],
+                is_gold=is_gold,
+                gold_best_word_id=members[0] if is_gold else None,
+                gold_worst_word_id=members[1] if is_gold else None,
+            ))
+        tuple_objs = WordTuple.objects.bulk_create(tuple_objs, batch_size=batch_size)
+        Through = WordTuple.words.through
+        Through.objects.bulk_create(
+            (Through(wordtuple_id=t.id, word_id=word_id)
+             for t, members in zip(tuple_objs, tuple_words) for word_id in members),
+            batch_size=batch_size,
+        )
+
+        by_dimension = {dimension: [] for dimension in SYNTHETIC_DIMENSIONS}
+        words_of = {}
+        for t, members in zip(tuple_objs, tuple_words):
+            by_dimension[t.dimension].append(t.id)
+            words_of[t.id] = members
+
+        # 작업자: 비밀번호 해시 없이 만들고 (로그인은 force_login), 프로필은 시그널 없이 생성
+        user_objs = User.objects.bulk_create(
+            (User(username=str(100000 + i), password='!') for i in range(users)), batch_size=batch_size
+        )
+        UserProfile.objects.bulk_create(
+            (UserProfile(user=user, sona_id=100000 + i, gender='MF'[i % 2], age=20 + i % 40,
+                         dimension=SYNTHETIC_DIMENSIONS[i % len(SYNTHETIC_DIMENSIONS)])
+             for i, user in enumerate(user_objs)),
+            batch_size=batch_size,
+        )
+        for dimension in SYNTHETIC_DIMENSIONS:
+            DimensionCounter.objects.update_or_create(
+                dimension=dimension,
+                defaults={'assigned_count': sum(1 for i in range(users) if
+                                                SYNTHETIC_DIMENSIONS[i % len(SYNTHETIC_DIMENSIONS)] == dimension)},
+            )
+
+        # 할당과 평가: 작업자당 평가 수 + PENDING_PER_USER개의 튜플을 할당하고 앞쪽만 평가
+        ratings_per_user = ratings // users if users else 0
+        assignments = []
+        rating_objs = []
+        assignment_count = rating_count = 0
+        for i, user in enumerate(user_objs):
+            dimension = SYNTHETIC_DIMENSIONS[i % len(SYNTHETIC_DIMENSIONS)]
+            pool = by_dimension[dimension]
+            chosen = rng.sample(pool, min(len(pool), ratings_per_user + PENDING_PER_USER))
+            for position, tuple_id in enumerate(chosen):
+                rated = position < ratings_per_user
+                assignments.append(UserWordTuple(user=user, word_tuple_id=tuple_id, completed=rated))
+                if rated:
+                    best, worst = rng.sample(words_of[tuple_id], 2)
+                    rating_objs.append(Rating(
+                        user=user, word_tuple_id=tuple_id, dimension=dimension,
+                        best_word_id=best, worst_word_id=worst,
+                        response_time=rng.randint(800, 8000),
+                    ))
+            if len(rating_objs) >= batch_size:
+                UserWordTuple.objects.bulk_create(assignments, batch_size=batch_size)
+                Rating.objects.bulk_create(rating_objs, batch_size=batch_size)
+                assignment_count += len(assignments)
+                rating_count += len(rating_objs)
+                assignments, rating_objs = [], []
+        UserWordTuple.objects.bulk_create(assignments, batch_size=batch_size)
+        Rating.objects.bulk_create(rating_objs, batch_size=batch_size)
+        assignment_count += len(assignments)
+        rating_count += len(rating_objs)
+
+        # bulk_create는 Rating.save를 거치지 않으므로 파생 카운터를 한 번에 다시 계산
+        recount_rating_totals(Word.objects.values('id'), UserProfile.objects.values('user_id'))
+        rebuild_bws_counters(batch_size)
+        recount_gold_counters()
+
+    refresh_dashboard_stats()
+
+    return {
+        'words': len(word_ids),
+        'tuples': len(tuple_objs),
+        'users': len(user_objs),
+        'assignments': assignment_count,
+        'ratings': rating_count,
+    }
@@ -9,4 +9,5 @@ urlpatterns = [
     path('intro2/', views.intro2, name='intro2'),
     path('practice/', views.practice, name='practice'),
     path('rate/', views.rate_words, name='rate_words'),
+    path('metrics/', views.request_metrics, name='request_metrics'),
 ]
\ No newline at end of file
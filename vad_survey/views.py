@@ -1,16 +1,20 @@
-import random
+import os
 
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
+from django.http import JsonResponse
 from django.shortcuts import render, redirect
 from django.utils import timezone
-from django.utils.safestring import mark_safe
 
 from .form import SignUpForm
+from .instructions import instruction_context
+from .middleware import METRICS, SAMPLE_SIZE
 from .models import UserProfile
 from .models import WordTuple, Rating, UserWordTuple  # UserWordTuple 추가
+from .services import get_current_user_tuple, get_user_progress
 
 
 @login_required
@@ -20,82 +24,15 @@ def intro(request):
     실험 시작 전 간략 안내 페이지를 보여주는 뷰.
     """
 
-    current_tuple_id = request.session.get('current_rating_tuple_id')
-    current_user_tuple = None
+    # 1. 현재 평가 중인 튜플 또는 새로 선택한 튜플
+    current_user_tuple = get_current_user_tuple(request)
 
-    if current_tuple_id:
-        # 세션에 저장된 튜플이 있으면 해당 튜플 가져오기
-        try:
-            current_user_tuple = UserWordTuple.objects.get(
-                id=current_tuple_id,
-                user=request.user,
-                completed=False
-            )
-        except UserWordTuple.DoesNotExist:
-            # 세션에 저장된 튜플이 없거나 이미 완료된 경우 세션에서 제거
-            if 'current_rating_tuple_id' in request.session:
-                del request.session['current_rating_tuple_id']
-
-    # 2. 사용자에게 할당된 미완료 튜플 가져오기 (현재 평가 중인 튜플이 없는 경우)
+    # 2. 평가할 튜플이 없는 경우
     if not current_user_tuple:
-        user_tuples = UserWordTuple.objects.filter(
-            user=request.user,
-            completed=False
-        ).select_related('word_tuple')
-
-        # 평가할 수 있는 튜플 찾기
-        available_tuples = []
-        for user_tuple in user_tuples:
-            word_tuple = user_tuple.word_tuple
-
-            # 해당 튜플의 dimension 확인 (V, A, D 중 하나)
-            tuple_dimension = word_tuple.dimension
-
-            # dimension이 설정되지 않은 경우 건너뛰기
-            if not tuple_dimension:
-                continue
-
-            # 이미 평가된 차원인지 확인
-            already_rated = Rating.objects.filter(
-                user=request.user,
-                word_tuple=word_tuple,
-                dimension=tuple_dimension
-            ).exists()
-
-            # 아직 평가되지 않은 경우에만 추가
-            if not already_rated:
-                available_tuples.append(user_tuple)
-
-        # 평가할 튜플이 없는 경우
-        if not available_tuples:
-            # 모든 작업이 완료되었거나, 모든 할당된 튜플의 차원이 이미 평가된 경우
-            for ut in user_tuples:
-                # 차원이 정의된 튜플만 확인
-                if not ut.word_tuple.dimension:
-                    continue
-
-                # 이미 평가되었는지 확인
-                is_rated = Rating.objects.filter(
-                    user=request.user,
-                    word_tuple=ut.word_tuple,
-                    dimension=ut.word_tuple.dimension
-                ).exists()
-
-                # 평가되었다면 완료 처리
-                if is_rated:
-                    ut.completed = True
-                    ut.save()
-
-            total_ratings = Rating.objects.filter(user=request.user).count()
-            return render(request, 'vad_survey/complete.html', {
-                'total_ratings': total_ratings
-            })
-
-        # 무작위로 평가할 튜플 선택
-        current_user_tuple = random.choice(available_tuples)
-
-        # 세션에 현재 평가 중인 튜플 저장
-        request.session['current_rating_tuple_id'] = current_user_tuple.id
+        total_ratings = Rating.objects.filter(user=request.user).count()
+        return render(request, 'vad_survey/complete.html', {
+            'total_ratings': total_ratings
+        })
 
     # 3. 현재 평가할 튜플 및 차원 설정
     word_tuple = current_user_tuple.word_tuple
@@ -105,22 +42,7 @@ def intro(request):
 
     return render(request, 'vad_survey/intro.html', {
         'dimension': {'code': dimension_code, 'name': dimension_name},
-        'message_valence' : {'valence_pos': 
-                             mark_safe('''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500"> [ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
-                             'valence_neg': 
-                             mark_safe('''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?''')
-                     },
-        'message_arousal' : {'arousal_h':
-                             mark_safe(''' <p>아래 4개의 단어 중<br>
-                             <span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
-                             <br>또는
-                             <br><span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
-                             'arousal_l':
-                             mark_safe(''' <p>아래 4개의 단어 중<br>
-                             <span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
-                             <br>또는
-                             <br><span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?''')
-                             },
+        **instruction_context(dimension_code),
         'test_words' : ['a', 'b', 'c', 'd']
     })
 
@@ -144,6 +66,10 @@ def practice(request):
         words = ('욕설','의무','책임','자유')
         correct_best = '자유'
         correct_worst = '욕설'
+    elif code == 'D':
+        words = ('무력한', '평범한', '책임', '강력한')
+        correct_best = '강력한'
+        correct_worst = '무력한'
     message = ''
 
     if request.method == 'POST':
@@ -160,22 +86,7 @@ def practice(request):
         'words': words,
         'message': message,
         'dimension': {'code': code, 'name': name},
-        'message_valence' : {'valence_pos': 
-                             mark_safe('''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500"> [ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
-                             'valence_neg': 
-                             mark_safe('''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?''')
-                     },
-        'message_arousal' : {'arousal_h':
-                             mark_safe(''' <p>아래 4개의 단어 중<br>
-                             <span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
-                             <br>또는
-                             <br><span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
-                             'arousal_l':
-                             mark_safe(''' <p>아래 4개의 단어 중<br>
-                             <span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
-                             <br>또는
-                             <br><span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?''')
-                             },
+        **instruction_context(code),
     })
 def intro2(request):
     return render(request, 'vad_survey/intro2.html')
@@ -184,93 +95,15 @@ def intro2(request):
 def rate_words(request):
     """특정 차원(V, A, D)의 단어 튜플을 평가하는 뷰"""
 
-    # 1. 현재 세션에 평가 중인 튜플이 있는지 확인
-    current_tuple_id = request.session.get('current_rating_tuple_id')
-    current_user_tuple = None
-
-    if current_tuple_id:
-        # 세션에 저장된 튜플이 있으면 해당 튜플 가져오기
-        try:
-            current_user_tuple = UserWordTuple.objects.get(
-                id=current_tuple_id,
-                user=request.user,
-                completed=False
-            )
-        except UserWordTuple.DoesNotExist:
-            # 세션에 저장된 튜플이 없거나 이미 완료된 경우 세션에서 제거
-            if 'current_rating_tuple_id' in request.session:
-                del request.session['current_rating_tuple_id']
+    # 1. 세션의 현재 튜플 확인, 없으면 평가 가능한 튜플 하나를 선택
+    current_user_tuple = get_current_user_tuple(request)
 
-    # 2. 사용자에게 할당된 미완료 튜플 가져오기 (현재 평가 중인 튜플이 없는 경우)
+    # 2. 평가할 튜플이 없는 경우 (모든 튜플 평가 완료)
     if not current_user_tuple:
-        user_tuples = UserWordTuple.objects.filter(
-            user=request.user,
-            completed=False
-        ).select_related('word_tuple')
-
-        # 모든 튜플 평가 완료 시 complete.html로 이동
-        if not user_tuples.exists():
-            total_ratings = Rating.objects.filter(user=request.user).count()
-            return render(request, 'vad_survey/complete.html', {
-                'total_ratings': total_ratings
-            })
-
-        # 평가할 수 있는 튜플 찾기
-        available_tuples = []
-        for user_tuple in user_tuples:
-            word_tuple = user_tuple.word_tuple
-
-            # 해당 튜플의 dimension 확인 (V, A, D 중 하나)
-            tuple_dimension = word_tuple.dimension
-
-            # dimension이 설정되지 않은 경우 건너뛰기
-            if not tuple_dimension:
-                continue
-
-            # 이미 평가된 차원인지 확인
-            already_rated = Rating.objects.filter(
-                user=request.user,
-                word_tuple=word_tuple,
-                dimension=tuple_dimension
-            ).exists()
-
-            # 아직 평가되지 않은 경우에만 추가
-            if not already_rated:
-                available_tuples.append(user_tuple)
-
-        # 평가할 튜플이 없는 경우
-        if not available_tuples:
-            # 모든 작업이 완료되었거나, 모든 할당된 튜플의 차원이 이미 평가된 경우
-            for ut in user_tuples:
-                # 차원이 정의된 튜플만 확인
-                if not ut.word_tuple.dimension:
-                    continue
-
-                # 이미 평가되었는지 확인
-                is_rated = Rating.objects.filter(
-                    user=request.user,
-                    word_tuple=ut.word_tuple,
-                    dimension=ut.word_tuple.dimension
-                ).exists()
-
-                # 평가되었다면 완료 처리
-                if is_rated:
-                    ut.completed = True
-                    ut.save()
-
-            total_ratings = Rating.objects.filter(user=request.user).count()
-            return render(request, 'vad_survey/complete.html', {
-                'total_ratings': total_ratings
-            })
-
-        # 무작위로 평가할 튜플 선택
-        current_user_tuple = random.choice(available_tuples)
-
-        # 세션에 현재 평가 중인 튜플 저장
-        request.session['current_rating_tuple_id'] = current_user_tuple.id
-
-        # 평가 시작 시간 기록
-        request.session['rating_start_time'] = timezone.now().isoformat()
+        total_ratings = Rating.objects.filter(user=request.user).count()
+        return render(request, 'vad_survey/complete.html', {
+            'total_ratings': total_ratings
+        })
 
     # 3. 현재 평가할 튜플 및 차원 설정
     word_tuple = current_user_tuple.word_tuple
@@ -313,8 +146,10 @@ def rate_words(request):
                             best_word = next(w for w in words if str(w.id) == best_word_id)
                             worst_word = next(w for w in words if str(w.id) == worst_word_id)
 
-                            # 세션에서 평가 시작 시간 가져오기
-                            start_time_str = request.session.get('rating_start_time')
+                            # 세션에서 평가 시작 시간 가져오기 (현재 튜플을 화면에 띄운 시각일 때만 사용)
+                            start_time_str = None
+                            if request.session.get('rating_start_tuple_id') == current_user_tuple.id:
+                                start_time_str = request.session.get('rating_start_time')
                             if start_time_str:
                                 try:
                                     start_time = timezone.datetime.fromisoformat(start_time_str)
@@ -323,8 +158,8 @@ def rate_words(request):
                             else:
                                 start_time = timezone.now()
 
-                            # Rating 객체 생성 부분
-                            rating = Rating.objects.create(
+                            # Rating 객체 생성 (응답 시간 하한과 할당 완료 처리는 Rating.save에서)
+                            Rating.objects.create(
                                 user=request.user,
                                 word_tuple=word_tuple,
                                 dimension=dimension_code,
@@ -333,20 +168,11 @@ def rate_words(request):
                                 start_time=start_time
                             )
 
-                            # response_time이 너무 짧으면 최소값으로 설정
-                            if not rating.response_time or rating.response_time < 500:
-                                rating.response_time = 500  # 최소 0.5초
-                                rating.save(update_fields=['response_time'])
-
-                            # 완료 처리
-                            current_user_tuple.completed = True
-                            current_user_tuple.save()
-
                             # 세션에서 현재 평가 중인 튜플과 시작 시간 제거
                             if 'current_rating_tuple_id' in request.session:
                                 del request.session['current_rating_tuple_id']
-                            if 'rating_start_time' in request.session:
-                                del request.session['rating_start_time']
+                            for key in ('rating_start_time', 'rating_start_tuple_id'):
+                                request.session.pop(key, None)
 
                             messages.success(request, '평가가 성공적으로 저장되었습니다.')
 
@@ -365,45 +191,24 @@ def rate_words(request):
     }
 
     # 새로운 평가를 시작할 때 시작 시간 설정
-    if 'rating_start_time' not in request.session:
+    # (세션 튜플이 만료되거나 완료되어 다른 튜플로 바뀐 경우에도 다시 기록)
+    if request.session.get('rating_start_tuple_id') != current_user_tuple.id:
+        request.session['rating_start_tuple_id'] = current_user_tuple.id
         request.session['rating_start_time'] = timezone.now().isoformat()
 
+    # 진행 현황 (단일 집계 쿼리)
+    progress = get_user_progress(request.user)
+
     return render(request, 'vad_survey/rate.html', {
         'words': words,
         'dimension': current_dimension,
         'word_tuple': word_tuple,
         'user_tuple_id': current_user_tuple.id,
-        'ratings_left': UserWordTuple.objects.filter(
-            user=request.user,
-            completed=False
-        ).count(),
-        'total_ratings': UserWordTuple.objects.filter(user=request.user).count(),
-        'completed_ratings': UserWordTuple.objects.filter(
-            user=request.user,
-            completed=True
-        ).count(),
-        'progress_rate': UserWordTuple.objects.filter(
-            user=request.user,
-            completed=True
-        ).count() / UserWordTuple.objects.filter(user=request.user).count() * 100,
-        'message_valence': {'valence_pos':
-                                mark_safe(
-                                    '''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500"> [ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
-                            'valence_neg':
-                                mark_safe(
-                                    '''<p>아래 4개의 단어 중 <span class="font-bold text-red-500">[ 불행 ], [ 성가심 ], [ 부정적인 것 ],[ 불만 ], [ 우울감 ], [ 절망 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요? <br><span class="font-bold text-red-500">또는</span> <span class="font-bold text-red-500">[ 행복 ], [ 기쁨 ], [ 긍정적인 것 ], [ 만족 ], [ 평온 ], [ 소망 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?''')
-                            },
-        'message_arousal': {'arousal_h':
-                                mark_safe(''' <p>아래 4개의 단어 중<br>
-                             <span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
-                             <br>또는
-                             <br><span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?'''),
-                            'arousal_l':
-                                mark_safe(''' <p>아래 4개의 단어 중<br>
-                             <span class="font-bold text-red-500"> [ 긴장풀린 ], [ 소극적인 ], [ 이완된 ],[ 차분한 ], [ 느린 ], [ 둔한 ], [ 나른한 ] </span>과 가장 관련성이 <span class="font-bold ">높은</span> 단어는 무엇인가요?
-                             <br>또는
-                             <br><span class="font-bold text-red-500">[ 긴장하는 ], [ 적극적인 ], [ 자극적인 ], [ 흥분하는 ], [ 떨리는 ], [ 깨어있는 ]</span>과 가장 관련성이 <span class="font-bold ">낮은</span> 단어는 무엇인가요?''')
-                            }
+        'ratings_left': progress['left'],
+        'total_ratings': progress['total'],
+        'completed_ratings': progress['completed'],
+        'progress_rate': progress['rate'],
+        **instruction_context(dimension_code),
     })
 
 def signup(request):
@@ -431,4 +236,14 @@ def signup(request):
             return redirect('vad_survey:intro') # 수정
     else:
         form = SignUpForm()
-    return render(request, 'registration/signup.html', {'form': form})
\ No newline at end of file
+    return render(request, 'registration/signup.html', {'form': form})
+
+
+@staff_member_required
+def request_metrics(request):
+    """뷰별 응답 시간, DB 시간, 쿼리 수의 p50/p95/p99 (이 프로세스의 최근 요청 기준)"""
+    return JsonResponse({
+        'pid': os.getpid(),
+        'sample_size': SAMPLE_SIZE,
+        'views': METRICS.summary(),
+    }, json_dumps_params={'ensure_ascii': False})